@@ -0,0 +1,145 @@
+"""Benchmarks for the probability engine and help table rendering.
+
+Usage: python bench.py [--quick] [--no-numpy] [--output PATH]
+
+Dice are generated from a fixed seed, so runs on the same machine are
+comparable. Each measurement is the best of several repeats. Results are
+printed and written to bench_output.txt (or PATH).
+"""
+
+import argparse
+import platform
+import random
+import sys
+import time
+
+import game
+from game import Die, HelpTableGenerator, ProbabilityCalculator
+
+# (number of dice, faces per die)
+SIZES = [(3, 6), (10, 6), (50, 20), (100, 100), (200, 1_000), (500, 1_000), (500, 10_000)]
+QUICK_SIZES = SIZES[:4]
+SEED = 2024
+# Variants whose estimated work exceeds these limits are reported as skipped.
+MAX_PAIRWISE_FACE_PAIRS = 2 * 10**8   # k*k calls of calculate_win_probability
+MAX_PYTHON_FACE_PAIRS = 2 * 10**8     # calculate_win_matrix without numpy
+MAX_TABLE_CHARS = 50 * 10**6          # rendered help table
+
+
+def make_dice(num_dice: int, num_faces: int, seed: int = SEED) -> list[Die]:
+    rng = random.Random(f"{seed}:{num_dice}x{num_faces}")
+    return [Die([rng.randrange(num_faces * 4) for _ in range(num_faces)]) for _ in range(num_dice)]
+
+
+def best_time(func, repeats: int = 5, budget: float = 2.0) -> float:
+    """Returns the fastest of up to ``repeats`` runs, stopping early once ``budget`` seconds are spent."""
+    best = float('inf')
+    spent = 0.0
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        spent += elapsed
+        if spent >= budget:
+            break
+    return best
+
+
+def best_time_per_call(func, min_time: float = 0.2, repeats: int = 5) -> float:
+    """Times fast calls in batches large enough to take about ``min_time`` seconds."""
+    calls = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        if time.perf_counter() - start >= min_time / 10 or calls >= 10**6:
+            break
+        calls *= 10
+    return best_time(lambda: [func() for _ in range(calls)], repeats) / calls
+
+
+def uncached_table(dice: list[Die]) -> str:
+    HelpTableGenerator._cache.clear()
+    return HelpTableGenerator.generate_table(dice, ProbabilityCalculator)
+
+
+def uncached_summary(dice: list[Die]) -> str:
+    HelpTableGenerator._cache.clear()
+    return HelpTableGenerator.generate_summary(dice, ProbabilityCalculator)
+
+
+def pairwise_matrix(dice: list[Die]) -> list[list[float]]:
+    return [[ProbabilityCalculator.calculate_win_probability(a, b) for b in dice] for a in dice]
+
+
+def python_matrix(dice: list[Die]) -> list[list[float]]:
+    numpy_module, game._numpy_module = game._numpy_module, None
+    try:
+        return ProbabilityCalculator.calculate_win_matrix(dice)
+    finally:
+        game._numpy_module = numpy_module
+
+
+def estimated_table_chars(dice: list[Die]) -> int:
+    label = max(len(str(d)) for d in dice) + 3
+    return 2 * (len(dice) + 2) * (len(dice) + 1) * label
+
+
+def run_size(num_dice: int, num_faces: int) -> list[tuple[str, str]]:
+    dice = make_dice(num_dice, num_faces)
+    face_pairs = num_dice * num_dice * num_faces * num_faces
+    results = []
+
+    def measure(name: str, func, skip_reason: str | None = None, per_call: bool = False):
+        if skip_reason:
+            results.append((name, f"skipped ({skip_reason})"))
+            return
+        seconds = best_time_per_call(func) if per_call else best_time(func)
+        results.append((name, f"{seconds * 1e3:12.3f} ms"))
+
+    measure("calculate_win_probability (one pair)",
+            lambda: ProbabilityCalculator.calculate_win_probability(dice[0], dice[1]), per_call=True)
+    measure("win matrix, pairwise calls", lambda: pairwise_matrix(dice),
+            "too slow" if face_pairs > MAX_PAIRWISE_FACE_PAIRS else None)
+    measure("calculate_win_matrix (numpy)", lambda: ProbabilityCalculator.calculate_win_matrix(dice),
+            None if game._numpy() is not None else "numpy not available")
+    measure("calculate_win_matrix (pure Python)", lambda: python_matrix(dice),
+            "too slow" if face_pairs > MAX_PYTHON_FACE_PAIRS else None)
+    measure("generate_table (uncached)", lambda: uncached_table(dice),
+            "output too large" if estimated_table_chars(dice) > MAX_TABLE_CHARS else None)
+    measure("generate_summary (uncached)", lambda: uncached_summary(dice))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--quick', action='store_true', help="only run the smaller sizes")
+    parser.add_argument('--no-numpy', action='store_true', help="benchmark without numpy even if installed")
+    parser.add_argument('--output', default='bench_output.txt', help="results file (default: bench_output.txt)")
+    args = parser.parse_args()
+    if args.no_numpy:
+        game._numpy_module = None
+
+    np = game._numpy()
+    lines = [f"Python {platform.python_version()} on {platform.platform()}",
+             f"numpy {np.__version__ if np is not None else 'disabled' if args.no_numpy else 'not installed'}",
+             f"seed {SEED}"]
+    for line in lines:
+        print(line)
+    for num_dice, num_faces in (QUICK_SIZES if args.quick else SIZES):
+        heading = f"\n{num_dice} dice x {num_faces} faces"
+        print(heading, flush=True)
+        lines.append(heading)
+        for name, result in run_size(num_dice, num_faces):
+            line = f"  {name:<40} {result}"
+            print(line, flush=True)
+            lines.append(line)
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        f.write("\n".join(lines) + "\n")
+    print(f"\nResults written to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
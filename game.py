@@ -1,11 +1,40 @@
-# External dependency: Before running, please install the 'tabulate' library.
-# You can do this by running: pip install tabulate
+# Optional dependency: 'numpy' vectorizes the win-probability matrix for large dice sets.
+#
+# Only cheap modules are imported at load time so that argument validation and
+# error paths start fast; crypto, numpy, asyncio, json and the executors are
+# imported by the code that needs them.
+
+from __future__ import annotations
 
 import sys
-import secrets
-import hmac
-import hashlib
-from tabulate import tabulate
+import os
+import struct
+import time
+from abc import ABC, abstractmethod
+from array import array
+from types import MappingProxyType
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    import asyncio
+    import queue
+    import random
+    import numpy as np
+
+_NOT_LOADED = object()
+_numpy_module = _NOT_LOADED
+
+def _numpy():
+    """Imports numpy on first use; returns None when it is not installed."""
+    global _numpy_module
+    if _numpy_module is _NOT_LOADED:
+        try:
+            import numpy
+        except ImportError:  # the pure-Python engine is used instead
+            numpy = None
+        _numpy_module = numpy
+    return _numpy_module
 
 # ==============================================================================
 # 1. Error Handling Class
@@ -29,26 +58,92 @@ class ValidationError(Exception):
 ValidationError.NOT_ENOUGH_DICE = ValidationError("Please specify at least three dice.")
 ValidationError.INCONSISTENT_FACES = ValidationError("All dice must have the same number of faces.")
 ValidationError.NON_INTEGER_VALUE = ValidationError("All dice faces must be integer values.")
+ValidationError.FACE_OUT_OF_RANGE = ValidationError("All dice faces must fit in a signed 64-bit integer.")
 
 # ==============================================================================
 # 2. Data Structure for a Die
 # ==============================================================================
 
 class Die:
-    def __init__(self, faces: list[int]):
-        self.faces = faces
+    """Immutable die backed by a compact int64 array, with statistics precomputed once.
+
+    A one-dimensional int64 memoryview (e.g. a slice of a MappedDiceSet) is
+    used as the face storage directly instead of being copied.
+    """
+    __slots__ = ('_faces', '_sorted_faces', '_str', '_histogram', '_min', '_max', '_hash')
+
+    def __init__(self, faces: Iterable[int]):
+        if isinstance(faces, memoryview) and faces.format == 'q' and faces.ndim == 1:
+            face_view = faces.toreadonly()
+        else:
+            face_view = memoryview(array('q', faces)).toreadonly()
+        sorted_array = array('q', sorted(face_view))
+        histogram = {}
+        for face in sorted_array:
+            histogram[face] = histogram.get(face, 0) + 1
+        set_slot = object.__setattr__
+        set_slot(self, '_faces', face_view)
+        set_slot(self, '_sorted_faces', memoryview(sorted_array).toreadonly())
+        set_slot(self, '_str', ",".join(map(str, face_view)))
+        set_slot(self, '_histogram', MappingProxyType(histogram))
+        set_slot(self, '_min', sorted_array[0] if sorted_array else None)
+        set_slot(self, '_max', sorted_array[-1] if sorted_array else None)
+        set_slot(self, '_hash', hash(face_view.tobytes()))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Die objects are immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Die objects are immutable")
+
+    @property
+    def faces(self) -> memoryview:
+        return self._faces
+
+    @property
+    def sorted_faces(self) -> memoryview:
+        return self._sorted_faces
+
+    @property
+    def histogram(self) -> Mapping[int, int]:
+        """Read-only map of each face value to the number of faces showing it, in ascending value order."""
+        return self._histogram
+
+    @property
+    def min_face(self) -> int | None:
+        return self._min
+
+    @property
+    def max_face(self) -> int | None:
+        return self._max
 
     def __str__(self) -> str:
-        return ",".join(map(str, self.faces))
+        return self._str
+
+    def __repr__(self) -> str:
+        return f"Die([{self._str}])"
 
     def __len__(self) -> int:
-        return len(self.faces)
+        return len(self._faces)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Die):
+            return NotImplemented
+        return self is other or (self._hash == other._hash and self._faces == other._faces)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self):
+        return Die, (self._faces.tolist(),)
 
 # ==============================================================================
 # 3. Command-Line Argument Parser
 # ==============================================================================
 
 class DiceParser:
+    FILE_OPTIONS = ('-f', '--file')
+
     @staticmethod
     def parse(args: list[str]) -> list[Die]:
         if len(args) < 3:
@@ -57,10 +152,214 @@ class DiceParser:
             dice_list = [Die([int(f) for f in arg.split(',') if f]) for arg in args]
         except ValueError:
             raise ValidationError.NON_INTEGER_VALUE
+        except OverflowError:
+            raise ValidationError.FACE_OUT_OF_RANGE
         if not all(len(d) == len(dice_list[0]) for d in dice_list):
             raise ValidationError.INCONSISTENT_FACES
         return dice_list
 
+    @staticmethod
+    def parse_command_line(args: list[str]) -> Sequence[Die]:
+        """Parses dice from argv, or loads them with DiceLoader when given '--file PATH'."""
+        if args and args[0] in DiceParser.FILE_OPTIONS:
+            if len(args) != 2:
+                raise ValidationError(f"'{args[0]}' expects exactly one path (use '-' for stdin).")
+            return DiceLoader.load(args[1])
+        return DiceParser.parse(args)
+
+    @staticmethod
+    def extract_options(args: list[str], flags: Iterable[str] = (),
+                        valued: Iterable[str] = ()) -> tuple[dict[str, str | bool], list[str]]:
+        """Splits leading options from the remaining arguments.
+
+        Names in ``flags`` are boolean switches (e.g. '--precommit'); names in
+        ``valued`` consume the following argument (e.g. '--transcript PATH').
+        """
+        flags, valued = set(flags), set(valued)
+        options = {}
+        index = 0
+        while index < len(args) and (args[index] in flags or args[index] in valued):
+            name = args[index]
+            if name in flags:
+                options[name] = True
+                index += 1
+            elif index + 1 < len(args):
+                options[name] = args[index + 1]
+                index += 2
+            else:
+                raise ValidationError(f"'{name}' expects a value.")
+        return options, args[index:]
+
+
+class DiceLoader:
+    """Streams dice from a text source, one die per line.
+
+    A line is either comma-separated faces (``2,2,4,4,9,9``) or a JSON array
+    (``[2, 2, 4, 4, 9, 9]``). Blank lines and lines starting with '#' are
+    skipped. Lines are validated as they are read, so a bad line is reported
+    before the rest of the source is consumed.
+    """
+
+    @staticmethod
+    def iter_dice(lines: Iterable[str]) -> Iterator[Die]:
+        num_faces = None
+        for line_number, line in enumerate(lines, start=1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            die = DiceLoader._parse_line(line, line_number)
+            if num_faces is None:
+                num_faces = len(die)
+            elif len(die) != num_faces:
+                raise ValidationError(
+                    f"Line {line_number}: {ValidationError.INCONSISTENT_FACES.message} "
+                    f"Expected {num_faces} faces, got {len(die)}.")
+            yield die
+
+    @staticmethod
+    def _parse_line(line: str, line_number: int) -> Die:
+        try:
+            if line.startswith('['):
+                import json
+                faces = json.loads(line)
+                if not isinstance(faces, list) or not all(
+                        isinstance(f, int) and not isinstance(f, bool) for f in faces):
+                    raise ValueError(line)
+                return Die(faces)
+            return Die(int(f) for f in line.split(',') if f.strip())
+        except ValueError:
+            raise ValidationError(f"Line {line_number}: {ValidationError.NON_INTEGER_VALUE.message}")
+        except OverflowError:
+            raise ValidationError(f"Line {line_number}: {ValidationError.FACE_OUT_OF_RANGE.message}")
+
+    @staticmethod
+    def load(path: str) -> Sequence[Die]:
+        """Loads dice from a file path, or from stdin when path is '-'.
+
+        Files in the binary DiceBinaryFormat are memory-mapped instead of parsed.
+        Reading from stdin consumes it, so the console game then needs
+        reopen_console_input() to prompt on the terminal.
+        """
+        try:
+            if path == '-':
+                dice_list = list(DiceLoader.iter_dice(sys.stdin))
+            elif DiceBinaryFormat.is_binary(path):
+                dice_list = MappedDiceSet(path)
+            else:
+                with open(path, encoding='utf-8') as source:
+                    dice_list = list(DiceLoader.iter_dice(source))
+        except OSError as e:
+            raise ValidationError(f"Cannot read dice file '{path}': {e.strerror}.")
+        if len(dice_list) < 3:
+            raise ValidationError.NOT_ENOUGH_DICE
+        return dice_list
+
+    @staticmethod
+    def reopen_console_input():
+        """Points sys.stdin back at the terminal after the dice were read from it."""
+        try:
+            sys.stdin = open('CONIN$' if sys.platform == "win32" else '/dev/tty', encoding='utf-8')
+        except OSError:
+            raise ValidationError("Dice were read from stdin ('--file -'), but there is no terminal "
+                                  "to read the game's answers from; use '--file PATH' or '--serve'.")
+
+class DiceBinaryFormat:
+    """Compact binary dice-set layout.
+
+    A 24-byte little-endian header (magic, version, padding, die count, face
+    count) followed by a contiguous die_count x face_count int64 face matrix.
+    """
+    MAGIC = b'NTDB'
+    VERSION = 1
+    HEADER = struct.Struct('<4sH2xqq')
+
+    @staticmethod
+    def is_binary(path: str) -> bool:
+        with open(path, 'rb') as source:
+            return source.read(len(DiceBinaryFormat.MAGIC)) == DiceBinaryFormat.MAGIC
+
+    @staticmethod
+    def write(path: str, dice: Iterable[Die]):
+        dice = list(dice)
+        num_faces = len(dice[0]) if dice else 0
+        if not all(len(d) == num_faces for d in dice):
+            raise ValidationError.INCONSISTENT_FACES
+        with open(path, 'wb') as target:
+            target.write(DiceBinaryFormat.HEADER.pack(
+                DiceBinaryFormat.MAGIC, DiceBinaryFormat.VERSION, len(dice), num_faces))
+            for die in dice:
+                faces = array('q', die.faces)
+                if sys.byteorder == 'big':
+                    faces.byteswap()
+                target.write(faces)
+
+
+class MappedDiceSet(Sequence):
+    """Read-only sequence of dice memory-mapped from a DiceBinaryFormat file.
+
+    Opening only validates the header; each Die is built on first access as a
+    view into the mapping. close() fails with BufferError while such dice are
+    still referenced elsewhere.
+    """
+    def __init__(self, path: str):
+        import mmap
+        self.path = path
+        with open(path, 'rb') as source:
+            self._mmap = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+        header = DiceBinaryFormat.HEADER
+        if len(self._mmap) < header.size:
+            self._invalid(path, "truncated header")
+        magic, version, self.num_dice, self.num_faces = header.unpack_from(self._mmap)
+        if magic != DiceBinaryFormat.MAGIC or version != DiceBinaryFormat.VERSION:
+            self._invalid(path, "unsupported format")
+        if self.num_faces < 1:
+            self._invalid(path, "dice must have at least one face")
+        if self.num_dice < 0 or \
+                len(self._mmap) != header.size + 8 * self.num_dice * self.num_faces:
+            self._invalid(path, "size does not match header")
+        self._faces = memoryview(self._mmap)[header.size:].cast('q')
+        self._dice = [None] * self.num_dice
+
+    def _invalid(self, path: str, reason: str):
+        self._mmap.close()
+        raise ValidationError(f"Invalid binary dice file '{path}': {reason}.")
+
+    def __len__(self) -> int:
+        return self.num_dice
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.num_dice))]
+        if index < 0:
+            index += self.num_dice
+        if not 0 <= index < self.num_dice:
+            raise IndexError("die index out of range")
+        die = self._dice[index]
+        if die is None:
+            start = index * self.num_faces
+            faces = self._faces[start:start + self.num_faces]
+            if sys.byteorder == 'big':
+                swapped = array('q', faces.tobytes())
+                swapped.byteswap()
+                faces = swapped
+            die = self._dice[index] = Die(faces)
+        return die
+
+    def close(self):
+        self._dice = [None] * self.num_dice
+        self._faces.release()
+        self._mmap.close()
+
+    def __reduce__(self):
+        # Pickles (e.g. for worker processes) as the path; the copy maps the file again.
+        return MappedDiceSet, (self.path,)
+
+    def __enter__(self) -> 'MappedDiceSet':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
 # ==============================================================================
 # 4. Cryptographic Operations Provider
 # ==============================================================================
@@ -68,63 +367,936 @@ class DiceParser:
 class CryptoProvider:
     @staticmethod
     def generate_key() -> bytes:
+        import secrets
         return secrets.token_bytes(32)
 
     @staticmethod
     def generate_secure_random(max_val: int) -> int:
+        import secrets
         return secrets.randbelow(max_val)
 
     @staticmethod
     def calculate_hmac(key: bytes, message_int: int) -> str:
+        import hashlib
+        import hmac
         message_bytes = str(message_int).encode('utf-8')
         h = hmac.new(key, message_bytes, hashlib.sha3_256)
         return h.hexdigest().upper()
 
+    @classmethod
+    def create_commitment(cls, max_val: int) -> 'Commitment':
+        """Draws a secret value in 0..max_val-1 and commits to it with a fresh key."""
+        value = cls.generate_secure_random(max_val)
+        key = cls.generate_key()
+        return Commitment(key, value, cls.calculate_hmac(key, value))
+
+
+class Commitment(NamedTuple):
+    key: bytes
+    value: int
+    hmac: str
+
+
+class CommitmentPool:
+    """Pre-generates commitments in background threads, one ready queue per value range.
+
+    Every commitment is still used exactly once and its HMAC is shown before the
+    user moves, so the commit-reveal guarantees are unchanged; only the key,
+    value and HMAC generation moves off the prompt's critical path.
+    """
+    def __init__(self, crypto: CryptoProvider, ranges: Iterable[int], size: int = 16):
+        import queue
+        import threading
+        self.crypto = crypto
+        self._queues = {}
+        for max_val in set(ranges):
+            ready = self._queues[max_val] = queue.Queue(maxsize=size)
+            threading.Thread(target=self._fill, args=(max_val, ready), daemon=True).start()
+
+    def _fill(self, max_val: int, ready: queue.Queue):
+        while True:
+            ready.put(self.crypto.create_commitment(max_val))
+
+    def take(self, max_val: int) -> Commitment:
+        """Returns a ready commitment, generating one inline if none is queued for this range."""
+        import queue
+        ready = self._queues.get(max_val)
+        if ready is not None:
+            try:
+                return ready.get_nowait()
+            except queue.Empty:
+                pass
+        return self.crypto.create_commitment(max_val)
+
+class MerkleMove(NamedTuple):
+    index: int
+    max_val: int
+    value: int
+    nonce: bytes
+    proof: list[tuple[str, str]]  # (sibling side 'L'/'R', sibling hash hex), leaf level first
+
+
+class MerkleCommitmentSession:
+    """Commits to a whole session of computer moves with one Merkle root.
+
+    The move for each slot of ``schedule`` (the value range of every move, in
+    order) is drawn up front. Only the root is published before play; each
+    reveal carries the value, its nonce and an inclusion proof of
+    O(log n) hashes that anyone can check with ``verify``.
+    """
+    def __init__(self, crypto: CryptoProvider, schedule: list[int]):
+        import secrets
+        self.crypto = crypto
+        self.schedule = list(schedule)
+        self._moves = [(crypto.generate_secure_random(max_val), secrets.token_bytes(16))
+                       for max_val in self.schedule]
+        self._levels = [[self.leaf_hash(i, max_val, value, nonce)
+                         for i, (max_val, (value, nonce)) in enumerate(zip(self.schedule, self._moves))]]
+        while len(self._levels[-1]) > 1:
+            level = self._levels[-1]
+            parents = [self.node_hash(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+            if len(level) % 2:
+                parents.append(level[-1])  # an unpaired node is promoted unchanged
+            self._levels.append(parents)
+        self.root = self._levels[-1][0].hex().upper() if self.schedule else ''
+        self.next_index = 0
+
+    @staticmethod
+    def leaf_hash(index: int, max_val: int, value: int, nonce: bytes) -> bytes:
+        import hashlib
+        return hashlib.sha3_256(b'\x00' + nonce + f"{index}:{max_val}:{value}".encode('utf-8')).digest()
+
+    @staticmethod
+    def node_hash(left: bytes, right: bytes) -> bytes:
+        import hashlib
+        return hashlib.sha3_256(b'\x01' + left + right).digest()
+
+    @property
+    def remaining(self) -> int:
+        return len(self.schedule) - self.next_index
+
+    def renew(self) -> 'MerkleCommitmentSession':
+        return MerkleCommitmentSession(self.crypto, self.schedule)
+
+    def next_move(self, max_val: int) -> MerkleMove:
+        index = self.next_index
+        if index >= len(self.schedule) or self.schedule[index] != max_val:
+            raise ValueError(f"Move {index} of this session was not committed for range 0..{max_val - 1}.")
+        self.next_index += 1
+        proof = []
+        position = index
+        for level in self._levels[:-1]:
+            sibling = position ^ 1
+            if sibling < len(level):
+                proof.append(('L' if sibling < position else 'R', level[sibling].hex().upper()))
+            position //= 2
+        value, nonce = self._moves[index]
+        return MerkleMove(index, max_val, value, nonce, proof)
+
+    @staticmethod
+    def verify(root: str, move: MerkleMove) -> bool:
+        import hmac
+        node = MerkleCommitmentSession.leaf_hash(move.index, move.max_val, move.value, move.nonce)
+        for side, sibling_hex in move.proof:
+            sibling = bytes.fromhex(sibling_hex)
+            if side == 'L':
+                node = MerkleCommitmentSession.node_hash(sibling, node)
+            else:
+                node = MerkleCommitmentSession.node_hash(node, sibling)
+        return hmac.compare_digest(node.hex().upper(), root.upper())
+
 # ==============================================================================
 # 5. Probability Calculation Logic
 # ==============================================================================
 
+class Outcomes(NamedTuple):
+    wins: int
+    draws: int
+    losses: int
+
+
 class ProbabilityCalculator:
+    @staticmethod
+    def _merge_count(sorted1: Sequence[int], sorted2: Sequence[int]) -> int:
+        wins = 0
+        below = 0  # number of sorted2 faces strictly lower than the current sorted1 face
+        n2 = len(sorted2)
+        for f1 in sorted1:
+            while below < n2 and sorted2[below] < f1:
+                below += 1
+            wins += below
+        return wins
+
+    @staticmethod
+    def _histogram_outcomes(values1: Sequence[int], counts1: Sequence[int],
+                            values2: Sequence[int], counts2: Sequence[int]) -> Outcomes:
+        """Merges two ascending value->count histograms; O(distinct values) instead of O(faces)."""
+        wins = draws = 0
+        below = 0  # faces of the second die strictly below the current value
+        position, n2 = 0, len(values2)
+        for value, count in zip(values1, counts1):
+            while position < n2 and values2[position] < value:
+                below += counts2[position]
+                position += 1
+            wins += count * below
+            if position < n2 and values2[position] == value:
+                draws += count * counts2[position]
+        total = sum(counts1) * sum(counts2)
+        return Outcomes(wins, draws, total - wins - draws)
+
+    @staticmethod
+    def _histogram_excess(die: Die) -> int:
+        # Twice the distinct values minus the faces; negative when faces repeat.
+        return 2 * len(die.histogram) - len(die)
+
+    @staticmethod
+    def _prefers_histogram(die1: Die, die2: Die) -> bool:
+        # Worth it once repeated faces at least halve the number of elements to merge,
+        # i.e. 2 * (distinct1 + distinct2) <= faces1 + faces2.
+        excess = ProbabilityCalculator._histogram_excess
+        return excess(die1) + excess(die2) <= 0
+
+    @staticmethod
+    def _pair_outcomes(die1: Die, die2: Die) -> Outcomes:
+        if ProbabilityCalculator._prefers_histogram(die1, die2):
+            h1, h2 = die1.histogram, die2.histogram
+            return ProbabilityCalculator._histogram_outcomes(
+                list(h1), list(h1.values()), list(h2), list(h2.values()))
+        return ProbabilityCalculator._merge_outcomes(die1.sorted_faces, die2.sorted_faces)
+
+    @staticmethod
+    def count_wins(die1: Die, die2: Die) -> int:
+        """Counts face pairs where die1 beats die2 with one merge pass over sorted faces or histograms."""
+        if ProbabilityCalculator._prefers_histogram(die1, die2):
+            return ProbabilityCalculator._pair_outcomes(die1, die2).wins
+        return ProbabilityCalculator._merge_count(die1.sorted_faces, die2.sorted_faces)
+
+    @staticmethod
+    def _merge_outcomes(sorted1: Sequence[int], sorted2: Sequence[int]) -> Outcomes:
+        wins = draws = 0
+        below = not_above = 0  # sorted2 faces < and <= the current sorted1 face
+        n2 = len(sorted2)
+        for f1 in sorted1:
+            while below < n2 and sorted2[below] < f1:
+                below += 1
+            if not_above < below:
+                not_above = below
+            while not_above < n2 and sorted2[not_above] == f1:
+                not_above += 1
+            wins += below
+            draws += not_above - below
+        return Outcomes(wins, draws, len(sorted1) * n2 - wins - draws)
+
+    @staticmethod
+    def count_outcomes(die1: Die, die2: Die) -> Outcomes:
+        """Counts die1's winning, drawing and losing face pairs against die2 in one merge pass."""
+        return ProbabilityCalculator._pair_outcomes(die1, die2)
+
+    @staticmethod
+    def calculate_outcome_probabilities(die1: Die, die2: Die) -> tuple[float, float, float]:
+        """Returns (P(win), P(draw), P(loss)) for die1 against die2."""
+        total_outcomes = len(die1) * len(die2)
+        if total_outcomes == 0:
+            return 0.0, 0.0, 0.0
+        wins, draws, losses = ProbabilityCalculator.count_outcomes(die1, die2)
+        return wins / total_outcomes, draws / total_outcomes, losses / total_outcomes
+
     @staticmethod
     def calculate_win_probability(die1: Die, die2: Die) -> float:
-        wins = sum(1 for f1 in die1.faces for f2 in die2.faces if f1 > f2)
         total_outcomes = len(die1) * len(die2)
-        return wins / total_outcomes if total_outcomes > 0 else 0.0
+        if total_outcomes == 0:
+            return 0.0
+        return ProbabilityCalculator.count_wins(die1, die2) / total_outcomes
+
+    @staticmethod
+    def count_win_matrix(dice: list[Die]) -> list[list[int]]:
+        """Returns wins[i][j], the number of face pairs where dice[i] beats dice[j]."""
+        if _numpy() is not None and dice and all(len(d) for d in dice):
+            return ProbabilityCalculator._count_below_matrices_numpy(dice, ('left',))[0].tolist()
+        return [[outcomes.wins for outcomes in row]
+                for row in ProbabilityCalculator._count_outcome_matrix_python(dice)]
+
+    @staticmethod
+    def count_outcome_matrix(dice: list[Die]) -> list[list[Outcomes]]:
+        """Returns outcomes[i][j], the win/draw/loss face-pair counts of dice[i] against dice[j]."""
+        if _numpy() is not None and dice and all(len(d) for d in dice):
+            wins, not_losses = (below.tolist() for below in
+                                ProbabilityCalculator._count_below_matrices_numpy(dice, ('left', 'right')))
+            return [[Outcomes(w, n - w, len(row_die) * len(col_die) - n)
+                     for w, n, col_die in zip(win_row, not_loss_row, dice)]
+                    for win_row, not_loss_row, row_die in zip(wins, not_losses, dice)]
+        return ProbabilityCalculator._count_outcome_matrix_python(dice)
+
+    @staticmethod
+    def _count_outcome_matrix_python(dice: list[Die]) -> list[list[Outcomes]]:
+        sorted_faces = [d.sorted_faces.tolist() for d in dice]
+        histograms = [(list(d.histogram), list(d.histogram.values())) for d in dice]
+        # Same per-pair rule as _prefers_histogram, with each die's term computed once.
+        excess = [ProbabilityCalculator._histogram_excess(d) for d in dice]
+        merge = ProbabilityCalculator._merge_outcomes
+        merge_histograms = ProbabilityCalculator._histogram_outcomes
+        return [[merge_histograms(*histograms[i], *histograms[j])
+                 if excess[i] + excess[j] <= 0 else merge(sorted_faces[i], sorted_faces[j])
+                 for j in range(len(dice))]
+                for i in range(len(dice))]
+
+    @staticmethod
+    def _count_below_matrices_numpy(dice: list[Die], sides: tuple[str, ...]) -> list['np.ndarray']:
+        """Per side, below[i][j] counts face pairs with the dice[j] face < ('left') or <= ('right') the dice[i] face.
+
+        Works on each die's value histogram: every column is one searchsorted per side of
+        all distinct values against dice[j]'s values, weighted by face counts via prefix
+        sums; one pass over the columns serves every side.
+        """
+        np = _numpy()
+        values = [np.fromiter(d.histogram.keys(), dtype=np.int64, count=len(d.histogram)) for d in dice]
+        counts = [np.fromiter(d.histogram.values(), dtype=np.int64, count=len(d.histogram)) for d in dice]
+        all_values, all_counts = np.concatenate(values), np.concatenate(counts)
+        starts = np.cumsum([0] + [len(v) for v in values[:-1]])
+        below = [np.empty((len(dice), len(dice)), dtype=np.int64) for _ in sides]
+        for j, (column_values, column_counts) in enumerate(zip(values, counts)):
+            prefix = np.concatenate(([0], np.cumsum(column_counts)))
+            for matrix, side in zip(below, sides):
+                weighted = prefix[np.searchsorted(column_values, all_values, side=side)] * all_counts
+                matrix[:, j] = np.add.reduceat(weighted, starts)
+        return below
+
+    @staticmethod
+    def calculate_win_matrix(dice: list[Die]) -> list[list[float]]:
+        """Returns probs[i][j], the probability that dice[i] beats dice[j]."""
+        wins = ProbabilityCalculator.count_win_matrix(dice)
+        return [
+            [w / (len(row_die) * len(col_die)) if len(row_die) * len(col_die) else 0.0
+             for w, col_die in zip(row, dice)]
+            for row, row_die in zip(wins, dice)
+        ]
+
+class BestResponse:
+    """The one rule for answering a die: maximize P(win) - P(loss) against it.
+
+    ``probability(i, j)`` is P(dice[i] beats dice[j]), e.g. a win-matrix lookup or
+    HelpTableGenerator.cell_lookup; ranking ties go to the lower index.
+    """
+    @staticmethod
+    def edges_against(probability: Callable[[int, int], float], size: int, i: int) -> list[float]:
+        """edges[j] = P(j beats i) - P(i beats j); a die cannot answer itself, so edges[i] is -inf."""
+        edges = [probability(j, i) - probability(i, j) for j in range(size)]
+        edges[i] = float('-inf')
+        return edges
+
+    @staticmethod
+    def ranked(edges: Sequence[float], n: int, positive_only: bool = False) -> list[int]:
+        """The indices of the n largest edges, best first."""
+        import heapq
+        top = heapq.nlargest(n, (j for j, edge in enumerate(edges) if edge != float('-inf')),
+                             key=edges.__getitem__)
+        return [j for j in top if edges[j] > 0] if positive_only else top
+
+    @staticmethod
+    def best(probability: Callable[[int, int], float], size: int, i: int) -> int:
+        return BestResponse.ranked(BestResponse.edges_against(probability, size, i), 1)[0]
+
+    @staticmethod
+    def matchups(probability: Callable[[int, int], float], size: int, i: int,
+                 n: int) -> tuple[list[int], list[int]]:
+        """Returns (targets, counters) for die i: the up to n dice it has the largest
+        positive edge over, and the up to n dice with the largest positive edge over it."""
+        edges = BestResponse.edges_against(probability, size, i)
+        counters = BestResponse.ranked(edges, n, positive_only=True)
+        edges = [-edge if j != i else edge for j, edge in enumerate(edges)]
+        return BestResponse.ranked(edges, n, positive_only=True), counters
+
+
+class ZeroSumSolution(NamedTuple):
+    row_strategy: list[float]
+    column_strategy: list[float]
+    value: float  # midpoint of the bounds below
+    gap: float    # upper minus lower bound on the game value; both strategies are gap-optimal
+    iterations: int
+
+
+class ZeroSumGameSolver:
+    """Fictitious-play solver for two-player zero-sum matrix games (row player maximizes).
+
+    After t rounds, max_i (A y_t)_i and min_j (x_t A)_j bracket the game value,
+    so the empirical strategies are within ``gap`` of optimal when it stops.
+    """
+    @staticmethod
+    def solve(payoff: list[list[float]], tolerance: float = 1e-3,
+              max_iterations: int = 100_000) -> ZeroSumSolution:
+        rows, columns = len(payoff), len(payoff[0])
+        if _numpy() is not None:
+            return ZeroSumGameSolver._solve_numpy(payoff, tolerance, max_iterations)
+        by_column = [list(column) for column in zip(*payoff)]
+        row_counts, column_counts = [0] * rows, [0] * columns
+        row_totals = [0.0] * rows        # payoff of each row against the column player's plays
+        column_totals = [0.0] * columns  # payoff of each column against the row player's plays
+        i, j = 0, 0
+        for t in range(1, max_iterations + 1):
+            row_counts[i] += 1
+            column_counts[j] += 1
+            row_totals = [total + value for total, value in zip(row_totals, by_column[j])]
+            column_totals = [total + value for total, value in zip(column_totals, payoff[i])]
+            upper, lower = max(row_totals) / t, min(column_totals) / t
+            if upper - lower <= tolerance:
+                break
+            i = row_totals.index(max(row_totals))
+            j = column_totals.index(min(column_totals))
+        return ZeroSumSolution([c / t for c in row_counts], [c / t for c in column_counts],
+                               (upper + lower) / 2, upper - lower, t)
+
+    @staticmethod
+    def _solve_numpy(payoff: list[list[float]], tolerance: float, max_iterations: int) -> ZeroSumSolution:
+        np = _numpy()
+        matrix = np.asarray(payoff, dtype=np.float64)
+        row_counts = np.zeros(matrix.shape[0], dtype=np.int64)
+        column_counts = np.zeros(matrix.shape[1], dtype=np.int64)
+        row_totals = np.zeros(matrix.shape[0])
+        column_totals = np.zeros(matrix.shape[1])
+        i, j = 0, 0
+        for t in range(1, max_iterations + 1):
+            row_counts[i] += 1
+            column_counts[j] += 1
+            row_totals += matrix[:, j]
+            column_totals += matrix[i]
+            i, j = int(row_totals.argmax()), int(column_totals.argmin())
+            upper, lower = row_totals[i] / t, column_totals[j] / t
+            if upper - lower <= tolerance:
+                break
+        return ZeroSumSolution((row_counts / t).tolist(), (column_counts / t).tolist(),
+                               float(upper + lower) / 2, float(upper - lower), t)
+
+
+class DominanceAnalyzer:
+    """Analyzes the "beats" tournament of a dice set.
+
+    Die i beats die j when P(i wins) > P(j wins) for the pair. The graph is
+    read off one win matrix; cycles, strongly connected components and the
+    minimax mixed strategy are then computed on that graph and its payoffs.
+    """
+    def __init__(self, win_matrix: list[list[float]]):
+        self.win_matrix = win_matrix
+        self.size = len(win_matrix)
+        indices = range(self.size)
+        self.payoff = [[win_matrix[i][j] - win_matrix[j][i] for j in indices] for i in indices]
+        self.beats = [[j for j in indices if self.payoff[i][j] > 0] for i in indices]
+
+    @classmethod
+    def from_dice(cls, dice: Sequence[Die]) -> 'DominanceAnalyzer':
+        return cls(ProbabilityCalculator.calculate_win_matrix(dice))
+
+    def strongly_connected_components(self) -> list[list[int]]:
+        """Tarjan's algorithm, iterative; components are returned in reverse topological order."""
+        index_of, low = [None] * self.size, [0] * self.size
+        on_stack = [False] * self.size
+        stack, components = [], []
+        counter = 0
+        for root in range(self.size):
+            if index_of[root] is not None:
+                continue
+            work = [(root, 0)]
+            while work:
+                node, edge = work.pop()
+                if edge == 0:
+                    index_of[node] = low[node] = counter
+                    counter += 1
+                    stack.append(node)
+                    on_stack[node] = True
+                successors = self.beats[node]
+                while edge < len(successors):
+                    successor = successors[edge]
+                    edge += 1
+                    if index_of[successor] is None:
+                        work.append((node, edge))
+                        work.append((successor, 0))
+                        break
+                    if on_stack[successor]:
+                        low[node] = min(low[node], index_of[successor])
+                else:
+                    if low[node] == index_of[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack[member] = False
+                            component.append(member)
+                            if member == node:
+                                break
+                        components.append(sorted(component))
+                    if work:
+                        parent = work[-1][0]
+                        low[parent] = min(low[parent], low[node])
+        return components
+
+    def find_cycles(self) -> list[list[int]]:
+        """Returns one short beats-cycle per non-trivial strongly connected component.
+
+        In a component without tied pairs the cycle is always shortened to length 3.
+        """
+        cycles = []
+        for component in self.strongly_connected_components():
+            if len(component) > 1:
+                cycles.append(self._shorten_cycle(self._cycle_in(set(component))))
+        return cycles
+
+    def _cycle_in(self, members: set[int]) -> list[int]:
+        # Every node of a non-trivial component has a successor inside it, so walking
+        # those edges must eventually revisit a node.
+        position = {}
+        path = []
+        node = min(members)
+        while node not in position:
+            position[node] = len(path)
+            path.append(node)
+            node = next(j for j in self.beats[node] if j in members)
+        return path[position[node]:]
+
+    def _shorten_cycle(self, cycle: list[int]) -> list[int]:
+        while len(cycle) > 3:
+            first, third = cycle[0], cycle[2]
+            if self.payoff[third][first] > 0:
+                return cycle[:3]
+            if self.payoff[first][third] > 0:
+                cycle = [first] + cycle[2:]
+            else:
+                break  # tied chord: no shortcut through this pair
+        return cycle
+
+    def count_cyclic_triples(self) -> int:
+        """Counts 3-cycles i > j > k > i using bitset intersections, O(k^2) big-int operations."""
+        out_bits = [sum(1 << j for j in successors) for successors in self.beats]
+        in_bits = [0] * self.size
+        for i, successors in enumerate(self.beats):
+            for j in successors:
+                in_bits[j] |= 1 << i
+        total = sum((out_bits[j] & in_bits[i]).bit_count()
+                    for i, successors in enumerate(self.beats) for j in successors)
+        return total // 3
+
+    def is_transitive(self) -> bool:
+        return all(len(component) == 1 for component in self.strongly_connected_components())
+
+    def minimax_strategy(self, tolerance: float = 1e-3) -> ZeroSumSolution:
+        """Mixed strategy over the dice that maximizes the worst-case expected P(win) - P(loss)."""
+        return ZeroSumGameSolver.solve(self.payoff, tolerance)
+
+class MixedStrategy:
+    """Probability distribution over die indices, sampled in O(1) with Walker's alias method."""
+    def __init__(self, weights: Sequence[float]):
+        total = float(sum(weights))
+        if total <= 0:
+            raise ValueError("A mixed strategy needs a positive total weight.")
+        self.probabilities = [w / total for w in weights]
+        size = len(weights)
+        scaled = [p * size for p in self.probabilities]
+        self._threshold = [1.0] * size
+        self._alias = list(range(size))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            low, high = small.pop(), large.pop()
+            self._threshold[low] = scaled[low]
+            self._alias[low] = high
+            scaled[high] -= 1.0 - scaled[low]
+            (small if scaled[high] < 1.0 else large).append(high)
+
+    @classmethod
+    def uniform_over(cls, size: int, support: Iterable[int]) -> 'MixedStrategy':
+        weights = [0.0] * size
+        for index in support:
+            weights[index] = 1.0
+        return cls(weights)
+
+    def sample(self, rng: random.Random) -> int:
+        index = rng.randrange(len(self._alias))
+        return index if rng.random() < self._threshold[index] else self._alias[index]
+
+
+class SelectionEquilibrium(NamedTuple):
+    first_mover: MixedStrategy
+    responses: list[MixedStrategy]  # indexed by the die the first mover picked
+    value: float                    # first mover's expected P(win) - P(loss) under optimal play
+
+
+class SelectionSolver:
+    """Optimal die-selection strategies for the first and second mover in _select_dice.
+
+    The second mover sees the first pick, so the game is solved by backward
+    induction: the second mover answers die i with any die maximizing its
+    P(win) - P(loss) against i, and the first mover's linear program
+    max_x sum_i x_i * value(i) is optimal exactly on the dice with the best
+    guaranteed value. Both strategies mix uniformly over tied optima.
+    Results are cached per dice set.
+    """
+    TIE_TOLERANCE = 1e-12
+    _CACHE_SIZE = 16
+    _cache: dict = {}
+
+    @staticmethod
+    def solve(win_matrix: list[list[float]]) -> SelectionEquilibrium:
+        size = len(win_matrix)
+        tolerance = SelectionSolver.TIE_TOLERANCE
+        responses = []
+        guaranteed = []
+        probability = lambda a, b: win_matrix[a][b]
+        for i in range(size):
+            payoffs = BestResponse.edges_against(probability, size, i)
+            best = max(payoffs)
+            responses.append(MixedStrategy.uniform_over(
+                size, (j for j, payoff in enumerate(payoffs) if payoff >= best - tolerance)))
+            guaranteed.append(-best)
+        value = max(guaranteed)
+        first_mover = MixedStrategy.uniform_over(
+            size, (i for i, g in enumerate(guaranteed) if g >= value - tolerance))
+        return SelectionEquilibrium(first_mover, responses, value)
+
+    @staticmethod
+    def for_dice(dice: Sequence[Die]) -> SelectionEquilibrium:
+        key = tuple(dice)
+        cache = SelectionSolver._cache
+        equilibrium = cache.get(key)
+        if equilibrium is None:
+            if len(cache) >= SelectionSolver._CACHE_SIZE:
+                del cache[next(iter(cache))]
+            win_matrix = HelpTableGenerator.get_win_matrix(dice, ProbabilityCalculator)
+            equilibrium = cache[key] = SelectionSolver.solve(win_matrix)
+        return equilibrium
 
 # ==============================================================================
 # 6. Help Table Generation
 # ==============================================================================
 
 class HelpTableGenerator:
+    _CACHE_SIZE = 16
+    # Keyed on (calculator, dice faces); values are [win matrix or None, rendered table or None,
+    # {(row, column): probability} for cells computed on their own by windowed views,
+    # {(row, n): (targets, counters)} for summary rows].
+    _cache: dict = {}
+    # Sets with more dice than this get a windowed help view instead of the full grid.
+    WINDOW_SIZE = 12
+    # 'table' always shows the grid (windowed for large sets), 'summary' the per-die
+    # matchup summary, and 'auto' the grid up to WINDOW_SIZE dice and the summary above it.
+    HELP_MODES = ('auto', 'table', 'summary')
+
+    def __init__(self, mode: str = 'auto'):
+        if mode not in self.HELP_MODES:
+            raise ValidationError(f"Unknown help mode '{mode}', expected one of: {', '.join(self.HELP_MODES)}.")
+        self.mode = mode
+
+    def uses_summary(self, num_dice: int) -> bool:
+        return self.mode == 'summary' or (self.mode == 'auto' and num_dice > self.WINDOW_SIZE)
+
+    def iter_help(self, all_dice: Sequence[Die], calculator: ProbabilityCalculator,
+                  rows: Sequence[int] | None = None, opponent: int | None = None, page: int = 0) -> Iterator[str]:
+        """Yields the help shown for the page-th '?' press at one prompt.
+
+        Small sets get the full table. Larger ones page through rows (default:
+        every die) WINDOW_SIZE dice at a time, wrapping around; a table window's
+        columns are the opponent's die when it is known, else the page's own dice.
+        """
+        size = self.WINDOW_SIZE
+        summary = self.uses_summary(len(all_dice))
+        if len(all_dice) <= size and not summary:
+            yield from self.iter_table(all_dice, calculator)
+            return
+        rows = range(len(all_dice)) if rows is None else rows
+        pages = max(1, -(-len(rows) // size))
+        page %= pages
+        block = rows[page * size:(page + 1) * size]
+        if summary:
+            yield self.generate_summary(all_dice, calculator, block)
+        else:
+            columns = [opponent] if opponent is not None else block
+            yield self.generate_window(all_dice, calculator, block, columns)
+        if pages > 1:
+            yield f"* Page {page + 1} of {pages}; press '?' again for the next page."
+
+    @staticmethod
+    def _cache_key(all_dice: list[Die], calculator: ProbabilityCalculator) -> tuple:
+        return calculator, tuple(all_dice)
+
+    @staticmethod
+    def _cached_entry(all_dice: list[Die], calculator: ProbabilityCalculator) -> list:
+        key = HelpTableGenerator._cache_key(all_dice, calculator)
+        cache = HelpTableGenerator._cache
+        entry = cache.get(key)
+        if entry is None:
+            if len(cache) >= HelpTableGenerator._CACHE_SIZE:
+                del cache[next(iter(cache))]
+            entry = cache[key] = [None, None, {}, {}]
+        return entry
+
+    @staticmethod
+    def get_win_matrix(all_dice: list[Die], calculator: ProbabilityCalculator) -> list[list[float]]:
+        """Returns the win matrix for the dice set, computing it only on first use."""
+        entry = HelpTableGenerator._cached_entry(all_dice, calculator)
+        if entry[0] is None:
+            entry[0] = calculator.calculate_win_matrix(all_dice)
+            entry[2].clear()
+        return entry[0]
+
+    @staticmethod
+    def cached_win_matrix(all_dice: Sequence[Die], calculator: ProbabilityCalculator) -> list[list[float]] | None:
+        """Returns the win matrix if it has already been computed, without computing it."""
+        entry = HelpTableGenerator._cache.get(HelpTableGenerator._cache_key(all_dice, calculator))
+        return entry[0] if entry is not None else None
+
     @staticmethod
     def generate_table(all_dice: list[Die], calculator: ProbabilityCalculator) -> str:
-        headers = ["User v PC >"] + [str(d) for d in all_dice]
-        table_data = []
-        for user_die in all_dice:
-            row = [str(user_die)]
-            for pc_die in all_dice:
-                prob = calculator.calculate_win_probability(user_die, pc_die)
-                cell = f"*{prob:.4f}*" if user_die is pc_die else f"{prob:.4f}"
-                row.append(cell)
-            table_data.append(row)
-        intro = ("\n--- Win Probability Table ---\n"
-                 "This table shows the probability of the User's die (rows) winning against the PC's die (columns).\n"
-                 "* Diagonal values show probability of a die winning against an identical one.\n")
-        return intro + tabulate(table_data, headers=headers, tablefmt="grid")
+        entry = HelpTableGenerator._cached_entry(all_dice, calculator)
+        if entry[1] is None:
+            entry[1] = HelpTableGenerator._render_table(
+                all_dice, HelpTableGenerator.get_win_matrix(all_dice, calculator))
+        return entry[1]
+
+    @staticmethod
+    def iter_table(all_dice: list[Die], calculator: ProbabilityCalculator) -> Iterator[str]:
+        """Yields the table for display: the cached text in one piece, or its lines as
+        they are rendered, caching the text once the last line has been yielded."""
+        entry = HelpTableGenerator._cached_entry(all_dice, calculator)
+        if entry[1] is not None:
+            yield entry[1]
+            return
+        matrix = HelpTableGenerator.get_win_matrix(all_dice, calculator)
+        lines = []
+        for line in HelpTableGenerator.iter_table_lines(all_dice, lambda i, j: matrix[i][j]):
+            lines.append(line)
+            yield line
+        entry[1] = "\n".join(lines)
+
+    @staticmethod
+    def cell_lookup(all_dice: Sequence[Die], calculator: ProbabilityCalculator) -> Callable[[int, int], float]:
+        """Returns probability(i, j) = P(all_dice[i] beats all_dice[j]) without building the matrix.
+
+        Reads the cached matrix when there is one; otherwise each pair is counted
+        once on first use, filling both (i, j) and (j, i), and kept with the set.
+        """
+        entry = HelpTableGenerator._cached_entry(all_dice, calculator)
+        matrix, cells = entry[0], entry[2]
+        if matrix is not None:
+            return lambda i, j: matrix[i][j]
+        def probability(i: int, j: int) -> float:
+            prob = cells.get((i, j))
+            if prob is None:
+                total = len(all_dice[i]) * len(all_dice[j])
+                wins, _, losses = calculator.count_outcomes(all_dice[i], all_dice[j])
+                prob = cells[i, j] = wins / total if total else 0.0
+                cells[j, i] = losses / total if total else 0.0
+            return prob
+        return probability
+
+    @staticmethod
+    def generate_window(all_dice: list[Die], calculator: ProbabilityCalculator,
+                        rows: Sequence[int], columns: Sequence[int]) -> str:
+        """Renders only the given rows and columns (indices into all_dice) of the table.
+
+        Cells come from the full matrix when it is already cached; otherwise each
+        one is computed on its own and kept, so nothing outside the window is evaluated.
+        """
+        probability = HelpTableGenerator.cell_lookup(all_dice, calculator)
+        lines = HelpTableGenerator.iter_table_lines(all_dice, probability, rows, columns)
+        if len(rows) == len(columns) == len(all_dice):
+            return "\n".join(lines)
+        note = (f"* Showing {len(rows)} of {len(all_dice)} rows and "
+                f"{len(columns)} of {len(all_dice)} columns.")
+        return "\n".join([next(lines), note, *lines])
+
+    @staticmethod
+    def top_matchups(matrix: list[list[float]], n: int = 1) -> tuple[list[list[int]], list[list[int]]]:
+        """Returns (targets, counters): for each die i, the up to n dice it has the largest
+        edge over and the up to n dice with the largest edge over it, best first.
+
+        The edge is P(win) - P(loss), as in BestResponse; only positive edges
+        count, so even matchups are never listed, and ties go to the lower index.
+        With numpy each row is partially sorted with np.partition, so only the
+        candidates for the top n are ordered; without it heapq.nlargest is used.
+        """
+        size = len(matrix)
+        n = min(n, size - 1)
+        if n <= 0:
+            return [[] for _ in range(size)], [[] for _ in range(size)]
+        np = _numpy()
+        if np is not None:
+            probabilities = np.array(matrix, dtype=np.float64)
+            edges = probabilities - probabilities.T
+            np.fill_diagonal(edges, -np.inf)
+            def best(rows: 'np.ndarray') -> list[list[int]]:
+                nth_best = -np.partition(-rows, n - 1, axis=1)[:, n - 1]
+                result = []
+                for row, threshold in zip(rows, nth_best):
+                    candidates = np.flatnonzero((row >= threshold) & (row > 0))
+                    order = np.argsort(-row[candidates], kind='stable')[:n]
+                    result.append(candidates[order].tolist())
+                return result
+            return best(edges), best(edges.T)
+        probability = lambda i, j: matrix[i][j]
+        rows = [BestResponse.matchups(probability, size, i, n) for i in range(size)]
+        return [targets for targets, _ in rows], [counters for _, counters in rows]
+
+    SUMMARY_INTRO = ("\n--- Matchup Summary ---\n"
+                     "For each of the User's dice: the PC's die it has the largest edge over "
+                     "(P(win) vs P(loss)), and the PC's die with the largest edge over it; "
+                     "'-' when every matchup is even or worse.")
+
+    @staticmethod
+    def _summary_row(all_dice: Sequence[Die], calculator: ProbabilityCalculator,
+                     i: int, n: int) -> tuple[list[int], list[int]]:
+        """Returns die i's top-n (targets, counters), memoized per row.
+
+        With the matrix cached every row comes from one top_matchups pass; otherwise
+        only row i is computed, from O(k) outcome counts via cell_lookup.
+        """
+        entry = HelpTableGenerator._cached_entry(all_dice, calculator)
+        rows = entry[3]
+        if (i, n) not in rows:
+            if entry[0] is not None:
+                for j, row in enumerate(zip(*HelpTableGenerator.top_matchups(entry[0], n))):
+                    rows[j, n] = row
+            else:
+                probability = HelpTableGenerator.cell_lookup(all_dice, calculator)
+                rows[i, n] = BestResponse.matchups(probability, len(all_dice), i, n)
+        return rows[i, n]
+
+    @staticmethod
+    def generate_summary(all_dice: list[Die], calculator: ProbabilityCalculator,
+                         rows: Sequence[int] | None = None, n: int = 1) -> str:
+        """Lists the top-n targets and counters of the first WINDOW_SIZE dice in rows
+        (default: every die); iter_help pages through the rest."""
+        probability = HelpTableGenerator.cell_lookup(all_dice, calculator)
+        rows = range(len(all_dice)) if rows is None else rows
+        rows = rows[:HelpTableGenerator.WINDOW_SIZE]
+        describe = lambda matchups: ", ".join(
+            f"[{all_dice[j]}] ({win:.4f} vs {loss:.4f})" for j, win, loss in matchups) or "-"
+        lines = [HelpTableGenerator.SUMMARY_INTRO]
+        for i in rows:
+            targets, counters = HelpTableGenerator._summary_row(all_dice, calculator, i, n)
+            beats = describe((j, probability(i, j), probability(j, i)) for j in targets)
+            beaten_by = describe((j, probability(j, i), probability(i, j)) for j in counters)
+            lines.append(f"[{all_dice[i]}] beats {beats}; countered by {beaten_by}")
+        return "\n".join(lines)
+
+    @staticmethod
+    def _render_table(all_dice: list[Die], matrix: list[list[float]]) -> str:
+        return "\n".join(HelpTableGenerator.iter_table_lines(all_dice, lambda i, j: matrix[i][j]))
+
+    TABLE_INTRO = ("\n--- Win Probability Table ---\n"
+                   "This table shows the probability of the User's die (rows) winning against the PC's die (columns).\n"
+                   "* Diagonal values show probability of a die winning against an identical one.")
+    CORNER_HEADER = "User v PC >"
+    CELL_WIDTH = len("*0.0000*")
+
+    @staticmethod
+    def iter_table_lines(all_dice: list[Die], probability: Callable[[int, int], float],
+                         rows: Sequence[int] | None = None,
+                         columns: Sequence[int] | None = None) -> Iterator[str]:
+        """Yields the intro and grid lines of the table one at a time.
+
+        probability(i, j) is called once per rendered cell; rows and columns
+        select dice by index and default to the whole set.
+
+        The grid matches what tabulate's "grid" format produced for this table:
+        every column is at least two characters wider than its header, and the
+        die column is right-aligned only when it holds plain numbers (single-face dice).
+        """
+        rows = range(len(all_dice)) if rows is None else rows
+        columns = range(len(all_dice)) if columns is None else columns
+        row_labels = [str(all_dice[i]) for i in rows]
+        column_labels = [str(all_dice[j]) for j in columns]
+        corner = HelpTableGenerator.CORNER_HEADER
+        label_width = max([len(corner) + 2] + [len(label) for label in row_labels])
+        align_label = (str.rjust if any(row_labels) and not any(',' in label for label in row_labels)
+                       else str.ljust)
+        widths = [label_width] + [max(len(label) + 2, HelpTableGenerator.CELL_WIDTH) for label in column_labels]
+        separator = "+" + "+".join("-" * (w + 2) for w in widths) + "+"
+
+        yield HelpTableGenerator.TABLE_INTRO
+        yield separator
+        yield "| " + " | ".join([align_label(corner, label_width)] +
+                                [label.ljust(w) for label, w in zip(column_labels, widths[1:])]) + " |"
+        yield separator.replace("-", "=")
+        for i, label in zip(rows, row_labels):
+            cells = [f"*{probability(i, j):.4f}*" if i == j else f"{probability(i, j):.4f}" for j in columns]
+            yield "| " + " | ".join([align_label(label, label_width)] +
+                                    [cell.ljust(w) for cell, w in zip(cells, widths[1:])]) + " |"
+            yield separator
+        if not row_labels:
+            yield separator
+
+class WinMatrix:
+    """Win-probability matrix for a mutable dice set, updated one die at a time.
+
+    Adding a die computes only its row and column (one outcome count per
+    existing die gives both directions); removing one drops them. The
+    rendered help table is cached until the next change.
+    """
+    def __init__(self, dice: Iterable[Die] = (), calculator: ProbabilityCalculator = ProbabilityCalculator):
+        self.calculator = calculator
+        self.dice = list(dice)
+        self.probabilities = calculator.calculate_win_matrix(self.dice)
+        self.version = 0
+        self._rendered = None
+
+    def __len__(self) -> int:
+        return len(self.dice)
+
+    def add_die(self, die: Die):
+        size = len(die)
+        new_row = []
+        for row, other in zip(self.probabilities, self.dice):
+            total = size * len(other)
+            wins, _, losses = self.calculator.count_outcomes(die, other)
+            new_row.append(wins / total if total else 0.0)
+            row.append(losses / total if total else 0.0)
+        self_total = size * size
+        new_row.append(self.calculator.count_wins(die, die) / self_total if self_total else 0.0)
+        self.probabilities.append(new_row)
+        self.dice.append(die)
+        self._changed()
+
+    def remove_die(self, index: int) -> Die:
+        die = self.dice.pop(index)
+        del self.probabilities[index]
+        for row in self.probabilities:
+            del row[index]
+        self._changed()
+        return die
+
+    def _changed(self):
+        self.version += 1
+        self._rendered = None
+
+    def render(self) -> str:
+        if self._rendered is None:
+            self._rendered = HelpTableGenerator._render_table(self.dice, self.probabilities)
+        return self._rendered
 
 # ==============================================================================
-# 7. Console User Interface
+# 7. User Interfaces
 # ==============================================================================
 
-class GameUI:
+class UserInterface(ABC):
+    """Synchronous UI, such as the console; the game drives it through SyncUIAdapter."""
+    @abstractmethod
     def display_message(self, text: str):
-        print(text)
+        ...
 
     def display_hmac(self, hmac_hex: str):
-        print(f"HMAC: {hmac_hex}")
+        self.display_message(f"HMAC: {hmac_hex}")
 
     def display_key_and_move(self, key: bytes, move: int, name: str = "My choice"):
-        print(f"{name}: {move} (Secret Key: {key.hex().upper()})")
+        self.display_message(f"{name}: {move} (Secret Key: {key.hex().upper()})")
+
+    @abstractmethod
+    def get_user_choice(self, prompt: str, options: list[str]) -> str:
+        """Returns the index of the chosen option as a string, or '?' for help."""
+
+    @abstractmethod
+    def confirm(self, prompt: str) -> bool:
+        """Asks a yes/no question; only 'y' counts as yes."""
+
+
+class GameUI(UserInterface):
+    def display_message(self, text: str):
+        print(text)
 
     def get_user_choice(self, prompt: str, options: list[str]) -> str:
         while True:
@@ -145,153 +1317,902 @@ class GameUI:
                     return str(choice_int)
             print("Invalid choice. Please enter a valid number, '?', or 'X'.")
 
+    def confirm(self, prompt: str) -> bool:
+        return input(prompt).strip().lower() == 'y'
+
+
+class SessionClosed(Exception):
+    """Raised by asynchronous UIs when the player exits or disconnects."""
+
+
+class AsyncUserInterface(ABC):
+    """Asynchronous UI used by FairInteraction and GameController.
+
+    Output methods stay synchronous and only buffer; implementations flush
+    pending output whenever they wait for input in read_line.
+    """
+    @abstractmethod
+    def display_message(self, text: str):
+        ...
+
+    def display_hmac(self, hmac_hex: str):
+        self.display_message(f"HMAC: {hmac_hex}")
+
+    def display_key_and_move(self, key: bytes, move: int, name: str = "My choice"):
+        self.display_message(f"{name}: {move} (Secret Key: {key.hex().upper()})")
+
+    @abstractmethod
+    async def read_line(self, prompt: str) -> str:
+        """Shows prompt and returns the next input line; raises SessionClosed at end of input."""
+
+    async def get_user_choice(self, prompt: str, options: list[str]) -> str:
+        menu = [f"\n{prompt}"] + [f" {i} - {option}" for i, option in enumerate(options)]
+        menu.append("\n ? - Help\n X - Exit")
+        while True:
+            self.display_message("\n".join(menu))
+            choice = (await self.read_line("Your choice: ")).strip().lower()
+
+            if choice == 'x':
+                self.display_message("Exiting game. Goodbye!")
+                raise SessionClosed()
+            if choice == '?':
+                return '?'
+            if choice.isdigit():
+                choice_int = int(choice)
+                if 0 <= choice_int < len(options):
+                    return str(choice_int)
+            self.display_message("Invalid choice. Please enter a valid number, '?', or 'X'.")
+
+    async def confirm(self, prompt: str) -> bool:
+        return (await self.read_line(prompt)).strip().lower() == 'y'
+
+
+class SyncUIAdapter(AsyncUserInterface):
+    """Presents a synchronous UserInterface to the asynchronous game core.
+
+    Its coroutines never suspend; they block on the wrapped UI, which is
+    fine for a single console session.
+    """
+    def __init__(self, ui: UserInterface):
+        self.ui = ui
+
+    @staticmethod
+    def wrap(ui: UserInterface | AsyncUserInterface) -> AsyncUserInterface:
+        return ui if isinstance(ui, AsyncUserInterface) else SyncUIAdapter(ui)
+
+    def display_message(self, text: str):
+        self.ui.display_message(text)
+
+    def display_hmac(self, hmac_hex: str):
+        self.ui.display_hmac(hmac_hex)
+
+    def display_key_and_move(self, key: bytes, move: int, name: str = "My choice"):
+        self.ui.display_key_and_move(key, move, name=name)
+
+    async def read_line(self, prompt: str) -> str:
+        raise NotImplementedError("get_user_choice and confirm are delegated to the wrapped UI")
+
+    async def get_user_choice(self, prompt: str, options: list[str]) -> str:
+        return self.ui.get_user_choice(prompt, options)
+
+    async def confirm(self, prompt: str) -> bool:
+        return self.ui.confirm(prompt)
+
+
+class StreamGameUI(AsyncUserInterface):
+    """UI for one asyncio stream connection, one line per answer."""
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    def display_message(self, text: str):
+        self.writer.write(text.encode('utf-8') + b'\n')
+
+    async def read_line(self, prompt: str) -> str:
+        self.writer.write(prompt.encode('utf-8'))
+        await self.writer.drain()
+        try:
+            line = await self.reader.readline()
+        except ValueError:  # the line exceeded the stream's buffer limit
+            raise SessionClosed()
+        if not line:
+            raise SessionClosed()
+        return line.decode('utf-8', 'replace')
+
+
+class QueueGameUI(AsyncUserInterface):
+    """UI backed by asyncio queues, for in-process front ends and test harnesses.
+
+    Every message and prompt is put on ``output``; answers are taken from
+    ``input``, where None signals that the player has gone away.
+    """
+    def __init__(self, input_queue: asyncio.Queue | None = None, output_queue: asyncio.Queue | None = None):
+        import asyncio
+        self.input = input_queue or asyncio.Queue()
+        self.output = output_queue or asyncio.Queue()
+
+    def display_message(self, text: str):
+        self.output.put_nowait(text)
+
+    async def read_line(self, prompt: str) -> str:
+        self.output.put_nowait(prompt)
+        line = await self.input.get()
+        if line is None:
+            raise SessionClosed()
+        return line
+
 # ==============================================================================
 # 8. Provably Fair Random Number Generation & Game Logic (CORRECTED)
 # ==============================================================================
 
 class FairInteraction:
-    def __init__(self, crypto: CryptoProvider, ui: GameUI, help_gen: HelpTableGenerator, dice: list[Die]):
+    def __init__(self, crypto: CryptoProvider, ui: UserInterface | AsyncUserInterface,
+                 help_gen: HelpTableGenerator, dice: list[Die],
+                 commitments: CommitmentPool | None = None, session: MerkleCommitmentSession | None = None,
+                 transcript: 'TranscriptLog | None' = None):
         self.crypto = crypto
-        self.ui = ui
+        self.ui = SyncUIAdapter.wrap(ui)
         self.help_gen = help_gen
         self.dice = dice
+        self.commitments = commitments
+        self.session = session
+        self.transcript = transcript
+
+    def _log(self, record_type: str, **fields):
+        if self.transcript is not None:
+            self.transcript.record(record_type, **fields)
+
+    def _commit(self, max_val: int) -> Commitment | MerkleMove:
+        if self.session is not None:
+            if self.session.remaining == 0 or self.session.schedule[self.session.next_index] != max_val:
+                self.session = self.session.renew()
+            if self.session.next_index == 0:
+                self.ui.display_message(
+                    f"\nI have committed to my next {len(self.session.schedule)} moves "
+                    f"(Merkle root={self.session.root}).")
+                self._log('session', root=self.session.root, moves=len(self.session.schedule))
+            move = self.session.next_move(max_val)
+            self._log('commit', range=max_val, move=move.index, root=self.session.root)
+            return move
+        if self.commitments is not None:
+            commitment = self.commitments.take(max_val)
+        else:
+            commitment = self.crypto.create_commitment(max_val)
+        self._log('commit', range=max_val, hmac=commitment.hmac)
+        return commitment
+
+    @staticmethod
+    def _describe_commitment(commitment: Commitment | MerkleMove) -> str:
+        if isinstance(commitment, MerkleMove):
+            return f"committed move #{commitment.index}"
+        return f"HMAC={commitment.hmac}"
 
-    def _show_help(self):
-        table = self.help_gen.generate_table(self.dice, ProbabilityCalculator)
-        self.ui.display_message(table)
+    def _reveal(self, commitment: Commitment | MerkleMove, name: str = "My choice"):
+        if isinstance(commitment, MerkleMove):
+            proof = " ".join(f"{side}:{sibling}" for side, sibling in commitment.proof)
+            self.ui.display_message(f"{name}: {commitment.value} (Move #{commitment.index}, "
+                                    f"Nonce: {commitment.nonce.hex().upper()}, Proof: [{proof}])")
+            self._log('merkle_reveal', range=commitment.max_val, move=commitment.index,
+                      value=commitment.value, nonce=commitment.nonce.hex(), proof=commitment.proof)
+        else:
+            self.ui.display_key_and_move(commitment.key, commitment.value, name=name)
+            self._log('reveal', key=commitment.key.hex(), value=commitment.value, hmac=commitment.hmac)
+
+    def _show_help(self, page: int = 0):
+        for part in self.help_gen.iter_help(self.dice, ProbabilityCalculator, page=page):
+            self.ui.display_message(part)
 
-    def determine_first_player(self) -> bool:
+    def _begin_coin_flip(self) -> Commitment | MerkleMove:
         self.ui.display_message("\nLet's determine who makes the first move.")
-        computer_bit = self.crypto.generate_secure_random(2)
-        key = self.crypto.generate_key()
-        hmac_val = self.crypto.calculate_hmac(key, computer_bit)
-        self.ui.display_message(f"I have chosen a random value in range 0..1 (HMAC={hmac_val}).")
-        
+        commitment = self._commit(2)
+        self.ui.display_message(f"I have chosen a random value in range 0..1 "
+                                f"({self._describe_commitment(commitment)}).")
+        return commitment
+
+    def _finish_coin_flip(self, commitment: Commitment | MerkleMove, user_bit: int) -> bool:
+        self._log('user_move', range=2, value=user_bit)
+        self._reveal(commitment)
+        return user_bit == commitment.value
+
+    def _begin_roll(self, max_val: int) -> Commitment | MerkleMove:
+        self.ui.display_message(f"I have chosen a random value in range 0..{max_val-1}.")
+        commitment = self._commit(max_val)
+        if isinstance(commitment, MerkleMove):
+            self.ui.display_message(f"Commitment: {self._describe_commitment(commitment)}")
+        else:
+            self.ui.display_hmac(commitment.hmac)
+        return commitment
+
+    def _finish_roll(self, commitment: Commitment | MerkleMove, max_val: int, user_move: int) -> int:
+        computer_move = commitment.value
+        result = (computer_move + user_move) % max_val
+        self._log('user_move', range=max_val, value=user_move)
+        self._reveal(commitment, name="My number")
+        self._log('fair_result', range=max_val, value=result)
+        self.ui.display_message(f"Fair random number result: ({computer_move} + {user_move}) mod {max_val} = {result}")
+        return result
+
+    async def determine_first_player(self) -> bool:
+        commitment = self._begin_coin_flip()
+        help_page = 0
         while True:
             options = ["0", "1"]
             # CORRECTED: Added the 'options' argument to the call
-            user_bit_str = self.ui.get_user_choice("Try to guess my choice.", options)
+            user_bit_str = await self.ui.get_user_choice("Try to guess my choice.", options)
             if user_bit_str == '?':
-                self._show_help()
+                self._show_help(help_page)
+                help_page += 1
                 continue
             
-            user_bit = int(user_bit_str)
-            self.ui.display_key_and_move(key, computer_bit)
-            return user_bit == computer_bit
+            return self._finish_coin_flip(commitment, int(user_bit_str))
 
-    def get_fair_roll_index(self, max_val: int, prompt: str) -> int:
-        self.ui.display_message(f"I have chosen a random value in range 0..{max_val-1}.")
-        computer_move = self.crypto.generate_secure_random(max_val)
-        key = self.crypto.generate_key()
-        hmac_val = self.crypto.calculate_hmac(key, computer_move)
-        self.ui.display_hmac(hmac_val)
-        
+    async def get_fair_roll_index(self, max_val: int, prompt: str) -> int:
+        commitment = self._begin_roll(max_val)
+        help_page = 0
         while True:
             options = [str(i) for i in range(max_val)]
             # CORRECTED: Added the 'options' argument to the call
-            user_move_str = self.ui.get_user_choice(prompt, options)
+            user_move_str = await self.ui.get_user_choice(prompt, options)
             if user_move_str == '?':
-                self._show_help()
+                self._show_help(help_page)
+                help_page += 1
                 continue
             
-            user_move = int(user_move_str)
-            result = (computer_move + user_move) % max_val
-            self.ui.display_key_and_move(key, computer_move, name="My number")
-            self.ui.display_message(f"Fair random number result: ({computer_move} + {user_move}) mod {max_val} = {result}")
-            return result
+            return self._finish_roll(commitment, max_val, int(user_move_str))
 
 # ==============================================================================
 # 9. Main Game Controller
 # ==============================================================================
 
+class RandomDieStrategy:
+    """Picks uniformly among the dice still available."""
+    def __init__(self, num_dice: int):
+        self.num_dice = num_dice
+
+    def choose_first(self, rng: random.Random) -> int:
+        return rng.randrange(self.num_dice)
+
+    def respond(self, opponent_index: int, rng: random.Random) -> int:
+        index = rng.randrange(self.num_dice - 1)
+        return index + 1 if index >= opponent_index else index
+
+
+class CounterPickStrategy(RandomDieStrategy):
+    """Answers every die with the one that maximizes P(win) - P(loss) against it.
+
+    The best response to each die is computed once from the win matrix, so
+    respond() is a single table lookup.
+    """
+    def __init__(self, win_matrix: list[list[float]]):
+        super().__init__(len(win_matrix))
+        probability = lambda i, j: win_matrix[i][j]
+        self.best_response = [BestResponse.best(probability, self.num_dice, i) for i in range(self.num_dice)]
+
+    def respond(self, opponent_index: int, rng: random.Random) -> int:
+        return self.best_response[opponent_index]
+
+
+class LazyCounterPickStrategy(RandomDieStrategy):
+    """CounterPickStrategy without the win matrix, for dice sets too large to tabulate.
+
+    The best response to a die is computed the first time that die is played,
+    from HelpTableGenerator.cell_lookup (the cached matrix if there is one,
+    otherwise one outcome count against every other die), and memoized.
+    """
+    def __init__(self, dice: Sequence[Die]):
+        super().__init__(len(dice))
+        self.dice = dice
+        self.best_response = {}
+
+    def respond(self, opponent_index: int, rng: random.Random) -> int:
+        response = self.best_response.get(opponent_index)
+        if response is None:
+            probability = HelpTableGenerator.cell_lookup(self.dice, ProbabilityCalculator)
+            response = self.best_response[opponent_index] = BestResponse.best(
+                probability, self.num_dice, opponent_index)
+        return response
+
+
+class EquilibriumStrategy(RandomDieStrategy):
+    """Samples the computer's die from the cached SelectionSolver distributions in O(1)."""
+    def __init__(self, equilibrium: SelectionEquilibrium):
+        super().__init__(len(equilibrium.responses))
+        self.equilibrium = equilibrium
+
+    def choose_first(self, rng: random.Random) -> int:
+        return self.equilibrium.first_mover.sample(rng)
+
+    def respond(self, opponent_index: int, rng: random.Random) -> int:
+        return self.equilibrium.responses[opponent_index].sample(rng)
+
+
 class GameController:
-    def __init__(self, dice: list[Die], ui: GameUI, interaction: FairInteraction):
+    SESSION_ROUNDS = 100
+    # Above this many face comparisons (dice^2 x faces) the win matrix is not built at
+    # startup and the computer plays LazyCounterPickStrategy instead of the equilibrium.
+    EQUILIBRIUM_MAX_WORK = 2_000_000
+
+    def __init__(self, dice: list[Die], ui: UserInterface | AsyncUserInterface, interaction: FairInteraction,
+                 transcript: 'TranscriptLog | None' = None, strategy: RandomDieStrategy | None = None,
+                 help_gen: HelpTableGenerator | None = None):
         self.all_dice = dice
-        self.ui = ui
+        self.ui = SyncUIAdapter.wrap(ui)
         self.interaction = interaction
+        self.help_gen = help_gen or HelpTableGenerator()
+        self.transcript = transcript
+        self.strategy = strategy or RandomDieStrategy(len(dice))
+        import secrets
+        self._rng = secrets.SystemRandom()
+        self._die_index = None
+
+    def _log(self, record_type: str, **fields):
+        if self.transcript is not None:
+            self.transcript.record(record_type, **fields)
+
+    def _index_of(self, die: Die) -> int:
+        if self._die_index is None:  # built on first use; a mapped set creates its dice here
+            self._die_index = {id(d): i for i, d in enumerate(self.all_dice)}
+        return self._die_index[id(die)]
+
+    @staticmethod
+    def default_strategy(dice: Sequence[Die]) -> RandomDieStrategy:
+        """Equilibrium play when the win matrix is cheap to build; otherwise counter-picks,
+        from a table when the matrix is already cached and computed per die when not."""
+        if len(dice) ** 2 * len(dice[0]) <= GameController.EQUILIBRIUM_MAX_WORK:
+            return EquilibriumStrategy(SelectionSolver.for_dice(dice))
+        matrix = HelpTableGenerator.cached_win_matrix(dice, ProbabilityCalculator)
+        if matrix is not None:
+            return CounterPickStrategy(matrix)
+        return LazyCounterPickStrategy(dice)
+
+    @staticmethod
+    def move_schedule(num_faces: int, rounds: int = SESSION_ROUNDS) -> list[int]:
+        """Value ranges of the computer's committed moves: per round a 0..1 draw and two rolls."""
+        return [2, num_faces, num_faces] * rounds
 
     def run(self):
+        """Plays to completion with a synchronous UI; use play() from async code.
+
+        SyncUIAdapter never suspends, so the coroutine is stepped directly: no
+        event loop to import or start, and Ctrl-C reaches input() unchanged.
+        """
+        game = self.play()
+        try:
+            game.send(None)
+        except StopIteration:
+            return
+        game.close()
+        raise RuntimeError("GameController.run() needs a synchronous UI; await play() instead.")
+
+    async def play(self):
         self.ui.display_message("--- Welcome to the Non-Transitive Dice Game! ---")
         while True:
-            self._play_round()
-            play_again = input("\nPlay another round? (y/n): ").strip().lower()
-            if play_again != 'y':
+            await self._play_round()
+            if not await self.ui.confirm("\nPlay another round? (y/n): "):
                 self.ui.display_message("Thanks for playing!")
                 break
 
-    def _play_round(self):
-        user_goes_first = self.interaction.determine_first_player()
-        player_die, computer_die = self._select_dice(user_goes_first)
-        
-        self.ui.display_message(f"\nYour die: [{player_die}]")
-        self.ui.display_message(f"My die:   [{computer_die}]")
-
-        num_faces = len(player_die)
-        self.ui.display_message("\n--- Time to roll! ---")
+    async def _play_round(self):
+        user_goes_first = await self.interaction.determine_first_player()
+        player_die, computer_die = await self._select_dice(user_goes_first)
+        num_faces = self._announce_dice(user_goes_first, player_die, computer_die)
         
         self.ui.display_message("\nIt is my time to roll.")
-        computer_roll_index = self.interaction.get_fair_roll_index(
+        computer_roll_index = await self.interaction.get_fair_roll_index(
             num_faces, f"Add your number modulo {num_faces}."
         )
-        computer_roll_value = computer_die.faces[computer_roll_index]
-        self.ui.display_message(f"Result of my roll is {computer_roll_value}.")
+        computer_roll_value = self._apply_roll('computer', computer_die, computer_roll_index)
 
         self.ui.display_message("\nIt is your time to roll.")
-        player_roll_index = self.interaction.get_fair_roll_index(
+        player_roll_index = await self.interaction.get_fair_roll_index(
             num_faces, f"Add your number modulo {num_faces}."
         )
-        player_roll_value = player_die.faces[player_roll_index]
-        self.ui.display_message(f"Result of your roll is {player_roll_value}.")
+        player_roll_value = self._apply_roll('user', player_die, player_roll_index)
         
+        self._report_result(player_roll_value, computer_roll_value)
+
+    def _announce_dice(self, user_goes_first: bool, player_die: Die, computer_die: Die) -> int:
+        self._log('dice', user_first=user_goes_first, user_die=str(player_die), computer_die=str(computer_die))
+        self.ui.display_message(f"\nYour die: [{player_die}]")
+        self.ui.display_message(f"My die:   [{computer_die}]")
+        self.ui.display_message("\n--- Time to roll! ---")
+        return len(player_die)
+
+    def _apply_roll(self, side: str, die: Die, roll_index: int) -> int:
+        roll_value = die.faces[roll_index]
+        whose = "my" if side == 'computer' else "your"
+        self.ui.display_message(f"Result of {whose} roll is {roll_value}.")
+        self._log('roll', side=side, index=roll_index, value=roll_value)
+        return roll_value
+
+    def _report_result(self, player_roll_value: int, computer_roll_value: int):
         self.ui.display_message("\n--- Results ---")
         self.ui.display_message(f"You rolled {player_roll_value}, I rolled {computer_roll_value}.")
         if player_roll_value > computer_roll_value:
+            outcome = 'win'
             self.ui.display_message(f"You won! ({player_roll_value} > {computer_roll_value})")
         elif computer_roll_value > player_roll_value:
+            outcome = 'loss'
             self.ui.display_message(f"I won! ({computer_roll_value} > {player_roll_value})")
         else:
+            outcome = 'draw'
             self.ui.display_message("It's a draw!")
+        self._log('result', user_roll=player_roll_value, computer_roll=computer_roll_value, outcome=outcome)
     
-    def _select_dice(self, user_goes_first: bool):
+    async def _select_dice(self, user_goes_first: bool):
         available_dice = list(self.all_dice)
         if user_goes_first:
             self.ui.display_message("You make the first move and choose the dice.")
-            player_die = self._get_player_die_choice(available_dice)
-            available_dice.remove(player_die)
-            computer_die = secrets.choice(available_dice)
+            player_die = await self._get_player_die_choice(available_dice)
+            computer_die = self._respond_to_die(player_die)
         else:
-            self.ui.display_message("I make the first move and choose the dice.")
-            computer_die = secrets.choice(available_dice)
-            available_dice.remove(computer_die)
-            self.ui.display_message(f"I choose dice [{computer_die}].")
-            player_die = self._get_player_die_choice(available_dice)
+            computer_die = self._choose_first_die(available_dice)
+            player_die = await self._get_player_die_choice(available_dice, computer_die)
         return player_die, computer_die
-    
-    def _get_player_die_choice(self, available_dice: list[Die]):
+
+    def _choose_first_die(self, available_dice: list[Die]) -> Die:
+        """Picks the computer's die as first mover and removes it from available_dice."""
+        self.ui.display_message("I make the first move and choose the dice.")
+        computer_die = available_dice.pop(self.strategy.choose_first(self._rng))
+        self.ui.display_message(f"I choose dice [{computer_die}].")
+        return computer_die
+
+    def _respond_to_die(self, player_die: Die) -> Die:
+        return self.all_dice[self.strategy.respond(self._index_of(player_die), self._rng)]
+
+    def _show_help(self, available_dice: list[Die] | None = None, opponent_die: Die | None = None,
+                   page: int = 0):
+        """Shows help for the dice the user can pick from, paged for large sets."""
+        rows = [self._index_of(d) for d in (available_dice or self.all_dice)]
+        opponent = self._index_of(opponent_die) if opponent_die is not None else None
+        for part in self.help_gen.iter_help(self.all_dice, ProbabilityCalculator, rows, opponent, page):
+            self.ui.display_message(part)
+
+    async def _get_player_die_choice(self, available_dice: list[Die], opponent_die: Die | None = None):
+        help_page = 0
         while True:
             options = [str(d) for d in available_dice]
-            choice_str = self.ui.get_user_choice("Select your dice:", options)
+            choice_str = await self.ui.get_user_choice("Select your dice:", options)
             if choice_str == '?':
-                table = HelpTableGenerator.generate_table(self.all_dice, ProbabilityCalculator)
-                self.ui.display_message(table)
+                self._show_help(available_dice, opponent_die, help_page)
+                help_page += 1
                 continue
             return available_dice[int(choice_str)]
 
 # ==============================================================================
-# 10. Main Execution Block
+# 10. Headless Batch Simulation
+# ==============================================================================
+
+class SimulationResult:
+    """Win/draw/loss counts from the player's perspective, per (player die, opponent die) pair."""
+    def __init__(self, num_dice: int):
+        self.num_dice = num_dice
+        # Flat k*k lists indexed by player_index * num_dice + opponent_index.
+        self.pair_wins = [0] * (num_dice * num_dice)
+        self.pair_draws = [0] * (num_dice * num_dice)
+        self.pair_losses = [0] * (num_dice * num_dice)
+
+    @property
+    def wins(self) -> int:
+        return sum(self.pair_wins)
+
+    @property
+    def draws(self) -> int:
+        return sum(self.pair_draws)
+
+    @property
+    def losses(self) -> int:
+        return sum(self.pair_losses)
+
+    @property
+    def rounds(self) -> int:
+        return self.wins + self.draws + self.losses
+
+    def pair_counts(self, player_index: int, opponent_index: int) -> tuple[int, int, int]:
+        slot = player_index * self.num_dice + opponent_index
+        return self.pair_wins[slot], self.pair_draws[slot], self.pair_losses[slot]
+
+    def merge(self, other: 'SimulationResult') -> 'SimulationResult':
+        for counts, other_counts in ((self.pair_wins, other.pair_wins),
+                                     (self.pair_draws, other.pair_draws),
+                                     (self.pair_losses, other.pair_losses)):
+            for slot, value in enumerate(other_counts):
+                counts[slot] += value
+        return self
+
+    def max_win_rate_deviation(self, win_matrix: list[list[float]]) -> float:
+        """Largest gap between an observed per-pair win rate and the exact win probability."""
+        deviation = 0.0
+        for i in range(self.num_dice):
+            for j in range(self.num_dice):
+                wins, draws, losses = self.pair_counts(i, j)
+                played = wins + draws + losses
+                if played:
+                    deviation = max(deviation, abs(wins / played - win_matrix[i][j]))
+        return deviation
+
+
+class GameSimulator:
+    """Plays rounds of the game between two die-selection strategies without any I/O.
+
+    Mirrors GameController._play_round: a fair coin decides who picks first, the
+    second mover picks from the remaining dice, then each side rolls its die once.
+    """
+    def __init__(self, dice: list[Die], player_strategy, opponent_strategy):
+        self.dice = dice
+        self.player_strategy = player_strategy
+        self.opponent_strategy = opponent_strategy
+
+    def run(self, rounds: int, seed: int | None = None) -> SimulationResult:
+        import random
+        rng = random.Random(seed)
+        num_dice = len(self.dice)
+        result = SimulationResult(num_dice)
+        faces = [d.faces.tolist() for d in self.dice]
+        sizes = [len(f) for f in faces]
+        pair_wins, pair_draws, pair_losses = result.pair_wins, result.pair_draws, result.pair_losses
+        player, opponent = self.player_strategy, self.opponent_strategy
+        rand = rng.random
+        for _ in range(rounds):
+            if rand() < 0.5:
+                player_index = player.choose_first(rng)
+                opponent_index = opponent.respond(player_index, rng)
+            else:
+                opponent_index = opponent.choose_first(rng)
+                player_index = player.respond(opponent_index, rng)
+            opponent_roll = faces[opponent_index][int(rand() * sizes[opponent_index])]
+            player_roll = faces[player_index][int(rand() * sizes[player_index])]
+            slot = player_index * num_dice + opponent_index
+            if player_roll > opponent_roll:
+                pair_wins[slot] += 1
+            elif player_roll < opponent_roll:
+                pair_losses[slot] += 1
+            else:
+                pair_draws[slot] += 1
+        return result
+
+_shard_simulator = None  # set in each ParallelSimulator worker process by _init_shard_worker
+
+
+def _init_shard_worker(simulator: 'GameSimulator'):
+    global _shard_simulator
+    _shard_simulator = simulator
+
+
+def _simulate_shard(rounds: int, seed: int) -> SimulationResult:
+    return _shard_simulator.run(rounds, seed)
+
+
+class ParallelSimulator:
+    """Shards GameSimulator rounds across worker processes and merges the per-pair counts.
+
+    The simulator is sent to each worker once, when the pool starts, rather than with every shard.
+    """
+    def __init__(self, simulator: GameSimulator, workers: int | None = None, shards_per_worker: int = 4):
+        self.simulator = simulator
+        self.workers = workers or os.cpu_count() or 1
+        self.shards_per_worker = shards_per_worker
+
+    @staticmethod
+    def shard_seed(base_seed: int, shard: int) -> int:
+        """Derives an independent RNG seed for each shard from the base seed."""
+        import hashlib
+        digest = hashlib.sha256(f"{base_seed}:{shard}".encode('utf-8')).digest()
+        return int.from_bytes(digest, 'big')
+
+    def run(self, rounds: int, seed: int | None = None) -> SimulationResult:
+        import secrets
+        from concurrent.futures import ProcessPoolExecutor
+        base_seed = secrets.randbits(128) if seed is None else seed
+        num_shards = max(1, min(rounds, self.workers * self.shards_per_worker))
+        shard_rounds = [rounds // num_shards + (1 if i < rounds % num_shards else 0)
+                        for i in range(num_shards)]
+        result = SimulationResult(len(self.simulator.dice))
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_shard_worker,
+                                 initargs=(self.simulator,)) as pool:
+            futures = [pool.submit(_simulate_shard, n, self.shard_seed(base_seed, i))
+                       for i, n in enumerate(shard_rounds)]
+            for future in futures:
+                result.merge(future.result())
+        return result
+
+# ==============================================================================
+# 11. Game Transcript & Audit
+# ==============================================================================
+
+class TranscriptLog:
+    """Append-only JSON-lines record of commitments, reveals, rolls and results.
+
+    Writes go through a large userspace buffer; the file is flushed and
+    fsync'ed once every ``sync_every`` records and on close, so a crash loses
+    at most the last unsynced batch.
+    """
+    def __init__(self, path: str, sync_every: int = 256, buffer_size: int = 1 << 16):
+        import json
+        self._file = open(path, 'a', encoding='utf-8', buffering=buffer_size)
+        self.sync_every = sync_every
+        self._unsynced = 0
+        self._encode = json.JSONEncoder(separators=(',', ':')).encode
+
+    def record(self, record_type: str, **fields):
+        entry = {'type': record_type, 'ts': round(time.time(), 6), **fields}
+        self._file.write(self._encode(entry) + '\n')
+        self._unsynced += 1
+        if self._unsynced >= self.sync_every:
+            self.sync()
+
+    def sync(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+
+    def close(self):
+        if not self._file.closed:
+            self.sync()
+            self._file.close()
+
+    def __enter__(self) -> 'TranscriptLog':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _verify_reveal_chunk(chunk: list[tuple]) -> list[int]:
+    """Returns the record numbers in the chunk whose reveal does not match its commitment.
+
+    Items are (record_number, key, value, hmac) for HMAC reveals and
+    (record_number, root, MerkleMove) for Merkle reveals.
+    """
+    import hmac
+    failures = []
+    for record_number, *reveal in chunk:
+        if len(reveal) == 2:
+            root, move = reveal
+            ok = MerkleCommitmentSession.verify(root, move)
+        else:
+            key, value, expected = reveal
+            actual = CryptoProvider.calculate_hmac(key, value)
+            ok = hmac.compare_digest(actual.encode('ascii'), expected.upper().encode('ascii', 'replace'))
+        if not ok:
+            failures.append(record_number)
+    return failures
+
+
+class VerificationReport(NamedTuple):
+    checked: int
+    failures: list[int]  # 1-based transcript line numbers
+    seconds: float
+
+    @property
+    def throughput(self) -> float:
+        return self.checked / self.seconds if self.seconds > 0 else float('inf')
+
+    @property
+    def ok(self) -> bool:
+        """True when at least one reveal was checked and none failed."""
+        return self.checked > 0 and not self.failures
+
+    def __str__(self) -> str:
+        if not self.checked:
+            status = "FAILED, no reveals to verify"
+        elif self.failures:
+            status = f"{len(self.failures)} FAILED (first lines: {self.failures[:10]})"
+        else:
+            status = "OK"
+        return (f"Verified {self.checked} commitments in {self.seconds:.3f}s "
+                f"({self.throughput:,.0f}/s): {status}")
+
+
+class TranscriptVerifier:
+    """Re-checks every commitment reveal in a JSON-lines transcript in bulk.
+
+    Each 'reveal' must match the 'commit' record just before it (same HMAC,
+    value within its range) and its key must reproduce that HMAC; each
+    'merkle_reveal' must match its 'commit' record and carry an inclusion
+    proof for the root of the last 'session' record. Unparseable lines and
+    reveals without a commitment count as failures.
+    The messages are tiny, so hashlib rarely releases the GIL for them; pass
+    processes=True to spread large audits across cores instead of threads.
+    """
+    CHUNK_SIZE = 4096
+
+    def __init__(self, workers: int | None = None, processes: bool = False):
+        self.workers = workers or os.cpu_count() or 1
+        self.processes = processes
+
+    @staticmethod
+    def _iter_reveals(lines: Iterable[str], failures: list[int]) -> Iterator[tuple]:
+        """Yields _verify_reveal_chunk items; failures found while pairing records are appended to failures."""
+        import json
+        root = None
+        commit = None  # the last commit record not yet revealed
+        for line_number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                record_type = record['type']
+                if record_type == 'session':
+                    root = str(record['root'])
+                    bytes.fromhex(root)
+                elif record_type == 'commit':
+                    commit = record
+                elif record_type == 'reveal':
+                    expected = str(record['hmac'])
+                    bytes.fromhex(expected)  # rejects non-hex (including non-ASCII) digests as malformed
+                    value = int(record['value'])
+                    matched, commit = commit, None
+                    if matched is None or str(matched.get('hmac')).upper() != expected.upper() \
+                            or not 0 <= value < int(matched['range']):
+                        failures.append(line_number)
+                        continue
+                    yield line_number, bytes.fromhex(record['key']), value, expected
+                elif record_type == 'merkle_reveal':
+                    move = MerkleMove(int(record['move']), int(record['range']), int(record['value']),
+                                      bytes.fromhex(record['nonce']),
+                                      [(str(side), str(sibling)) for side, sibling in record['proof']])
+                    matched, commit = commit, None
+                    if root is None or matched is None or str(matched.get('root')) != root \
+                            or matched.get('move') != move.index or matched.get('range') != move.max_val \
+                            or not 0 <= move.value < move.max_val:
+                        failures.append(line_number)
+                        continue
+                    for _, sibling in move.proof:
+                        bytes.fromhex(sibling)
+                    yield line_number, root, move
+            except (ValueError, TypeError, KeyError, AttributeError):
+                failures.append(line_number)
+
+    def verify(self, lines: Iterable[str]) -> VerificationReport:
+        import itertools
+        from collections import deque
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+        start = time.perf_counter()
+        malformed = []
+        failures = []
+        checked = 0
+        executor_class = ProcessPoolExecutor if self.processes else ThreadPoolExecutor
+        with executor_class(max_workers=self.workers) as pool:
+            pending = deque()
+            reveals = self._iter_reveals(lines, malformed)
+            while True:
+                chunk = list(itertools.islice(reveals, self.CHUNK_SIZE))
+                if not chunk:
+                    break
+                checked += len(chunk)
+                pending.append(pool.submit(_verify_reveal_chunk, chunk))
+                if len(pending) > 2 * self.workers:  # bound the number of chunks held in memory
+                    failures.extend(pending.popleft().result())
+            for future in pending:
+                failures.extend(future.result())
+        return VerificationReport(checked + len(malformed), sorted(malformed + failures),
+                                  time.perf_counter() - start)
+
+    def verify_file(self, path: str) -> VerificationReport:
+        with open(path, encoding='utf-8') as transcript:
+            return self.verify(transcript)
+
+# ==============================================================================
+# 12. Asyncio Game Server
 # ==============================================================================
 
+class GameServer:
+    """Hosts one independent game session per TCP connection on a single event loop.
+
+    The protocol is plain text: the server sends the same prompts as the
+    console game and reads one answer per line.
+    """
+    def __init__(self, dice: Sequence[Die], host: str = '127.0.0.1', port: int = 0,
+                 crypto: CryptoProvider | None = None, commitments: CommitmentPool | None = None,
+                 help_gen: HelpTableGenerator | None = None, merkle: bool = False):
+        self.dice = dice
+        self.host = host
+        self.port = port
+        self.crypto = crypto or CryptoProvider()
+        self.commitments = commitments
+        self.help_gen = help_gen or HelpTableGenerator()
+        self.merkle = merkle
+        self.strategy = GameController.default_strategy(dice)
+        self.active_sessions = 0
+        self._server = None
+
+    async def start(self) -> asyncio.AbstractServer:
+        import asyncio
+        self._server = await asyncio.start_server(self._handle_session, self.host, self.port,
+                                                  backlog=4096)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self._server
+
+    async def serve_forever(self):
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def _handle_session(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.active_sessions += 1
+        ui = StreamGameUI(reader, writer)
+        session = None
+        if self.merkle:  # each connection commits to its own moves
+            session = MerkleCommitmentSession(self.crypto, GameController.move_schedule(len(self.dice[0])))
+        interaction = FairInteraction(self.crypto, ui, self.help_gen, self.dice, self.commitments, session)
+        controller = GameController(self.dice, ui, interaction, strategy=self.strategy, help_gen=self.help_gen)
+        try:
+            await controller.play()
+            await writer.drain()
+        except (SessionClosed, ConnectionError):
+            pass
+        finally:
+            self.active_sessions -= 1
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    @staticmethod
+    def parse_address(address: str) -> tuple[str, int]:
+        """Parses '[HOST:]PORT' into a (host, port) pair."""
+        host, _, port = address.rpartition(':')
+        try:
+            return host or '127.0.0.1', int(port)
+        except ValueError:
+            raise ValidationError(f"Invalid server address '{address}', expected [HOST:]PORT.")
+
+# ==============================================================================
+# 13. Main Execution Block
+# ==============================================================================
+
+async def _run_server(server: GameServer):
+    await server.start()
+    print(f"Serving the dice game on {server.host}:{server.port} (Ctrl+C to stop).")
+    await server.serve_forever()
+
 def main():
+    transcript = None
     try:
-        args = sys.argv[1:]
-        dice = DiceParser.parse(args)
+        if sys.argv[1:2] == ['--verify']:
+            if len(sys.argv) != 3:
+                raise ValidationError("'--verify' expects exactly one transcript path.")
+            try:
+                report = TranscriptVerifier().verify_file(sys.argv[2])
+            except OSError as e:
+                raise ValidationError(f"Cannot read transcript '{sys.argv[2]}': {e.strerror}.")
+            print(report)
+            sys.exit(0 if report.ok else 1)
+
+        options, args = DiceParser.extract_options(
+            sys.argv[1:], flags=['--precommit', '--merkle'], valued=['--transcript', '--serve', '--help-mode'])
+        dice = DiceParser.parse_command_line(args)
+        if args[:1] and args[0] in DiceParser.FILE_OPTIONS and args[1:] == ['-'] and '--serve' not in options:
+            DiceLoader.reopen_console_input()
         
         ui = GameUI()
         crypto = CryptoProvider()
-        help_gen = HelpTableGenerator()
-        interaction = FairInteraction(crypto, ui, help_gen, dice)
+        help_gen = HelpTableGenerator(options.get('--help-mode', 'auto'))
+        commitments = CommitmentPool(crypto, [2, len(dice[0])]) if '--precommit' in options else None
+        if '--serve' in options:
+            if '--transcript' in options:
+                raise ValidationError("'--transcript' cannot be combined with '--serve'; "
+                                      "records of concurrent sessions would interleave.")
+            host, port = GameServer.parse_address(options['--serve'])
+            import asyncio
+            asyncio.run(_run_server(GameServer(dice, host, port, crypto, commitments, help_gen,
+                                               merkle='--merkle' in options)))
+            return
+        session = None
+        if '--merkle' in options:
+            session = MerkleCommitmentSession(crypto, GameController.move_schedule(len(dice[0])))
+        if '--transcript' in options:
+            try:
+                transcript = TranscriptLog(options['--transcript'])
+            except OSError as e:
+                raise ValidationError(f"Cannot open transcript '{options['--transcript']}': {e.strerror}.")
+        interaction = FairInteraction(crypto, ui, help_gen, dice, commitments, session, transcript)
         
-        controller = GameController(dice, ui, interaction)
+        strategy = GameController.default_strategy(dice)
+        controller = GameController(dice, ui, interaction, transcript, strategy, help_gen)
         controller.run()
 
     except ValidationError as e:
@@ -300,6 +2221,9 @@ def main():
     except (KeyboardInterrupt, EOFError):
         print("\nGame interrupted. Goodbye!")
         sys.exit(0)
+    finally:
+        if transcript is not None:
+            transcript.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
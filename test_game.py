@@ -0,0 +1,74 @@
+"""Equivalence checks for the face-pair counting paths of ProbabilityCalculator.
+
+Run with: python -m unittest test_game
+"""
+
+import random
+import unittest
+
+import game
+from game import Die, Outcomes, ProbabilityCalculator
+
+
+def brute_force_outcomes(die1: Die, die2: Die) -> Outcomes:
+    """The O(n*m) baseline: compares every face of die1 with every face of die2."""
+    faces1, faces2 = list(die1.faces), list(die2.faces)
+    wins = sum(1 for a in faces1 for b in faces2 if a > b)
+    draws = sum(1 for a in faces1 for b in faces2 if a == b)
+    return Outcomes(wins, draws, len(faces1) * len(faces2) - wins - draws)
+
+
+def random_dice(rng: random.Random) -> list[Die]:
+    """Mixes dice with few repeated faces (merge path) and many (histogram path)."""
+    dice = []
+    for _ in range(rng.randint(2, 8)):
+        num_faces = rng.randint(1, 40)
+        value_range = rng.choice([3, num_faces, 5 * num_faces])
+        dice.append(Die([rng.randrange(value_range) for _ in range(num_faces)]))
+    return dice
+
+
+class OutcomeCountingTest(unittest.TestCase):
+    SEEDS = range(200)
+
+    def setUp(self):
+        self.numpy_module = game._numpy_module
+
+    def tearDown(self):
+        game._numpy_module = self.numpy_module
+
+    def test_pair_paths_match_baseline(self):
+        for seed in self.SEEDS:
+            rng = random.Random(seed)
+            for die1 in random_dice(rng):
+                for die2 in random_dice(rng):
+                    expected = brute_force_outcomes(die1, die2)
+                    h1, h2 = die1.histogram, die2.histogram
+                    with self.subTest(seed=seed, die1=str(die1), die2=str(die2)):
+                        self.assertEqual(ProbabilityCalculator._merge_outcomes(
+                            die1.sorted_faces.tolist(), die2.sorted_faces.tolist()), expected)
+                        self.assertEqual(ProbabilityCalculator._histogram_outcomes(
+                            list(h1), list(h1.values()), list(h2), list(h2.values())), expected)
+                        self.assertEqual(ProbabilityCalculator.count_outcomes(die1, die2), expected)
+                        self.assertEqual(ProbabilityCalculator.count_wins(die1, die2), expected.wins)
+
+    def test_matrix_paths_match_baseline(self):
+        numpy_available = game._numpy() is not None
+        for seed in self.SEEDS:
+            dice = random_dice(random.Random(seed))
+            expected = [[brute_force_outcomes(a, b) for b in dice] for a in dice]
+            with self.subTest(seed=seed, engine='python'):
+                game._numpy_module = None
+                self.assertEqual(ProbabilityCalculator.count_outcome_matrix(dice), expected)
+                self.assertEqual(ProbabilityCalculator.count_win_matrix(dice),
+                                 [[o.wins for o in row] for row in expected])
+                game._numpy_module = self.numpy_module
+            if numpy_available:
+                with self.subTest(seed=seed, engine='numpy'):
+                    self.assertEqual(ProbabilityCalculator.count_outcome_matrix(dice), expected)
+                    self.assertEqual(ProbabilityCalculator.count_win_matrix(dice),
+                                     [[o.wins for o in row] for row in expected])
+
+
+if __name__ == "__main__":
+    unittest.main()